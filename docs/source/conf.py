@@ -32,6 +32,7 @@ intersphinx_mapping = {
 }
 
 templates_path = ["_templates"]
+exclude_patterns = ["_build", "**/__pycache__"]
 
 
 # -- Options for HTML output -------------------------------------------------
@@ -1,4 +1,6 @@
+import json
 import os
+from pathlib import Path
 from typing import List
 
 import pytest
@@ -7,21 +9,65 @@ from click.testing import CliRunner
 from tests.resources.ABI import (
     ERC20_ABI_JSON,
     ERC721_ABI_JSON,
+    SYNC_SWAP_CLASSIC_PAIR_JSON,
+    SYNC_SWAP_ROUTER_JSON,
+    SYNC_SWAP_STABLE_PAIR_JSON,
     UNISWAP_V2_PAIR_JSON,
     UNISWAP_V3_POOL_JSON,
 )
 
+# ABI JSON is parsed once at import, and the compact bytes re-used for every fixture invocation
+PARSED_ABIS: dict[str, dict] = {
+    "ERC20": json.loads(ERC20_ABI_JSON),
+    "ERC721": json.loads(ERC721_ABI_JSON),
+    "UniswapV2Pair": json.loads(UNISWAP_V2_PAIR_JSON),
+    "UniswapV3Pool": json.loads(UNISWAP_V3_POOL_JSON),
+    "SyncSwapRouter": json.loads(SYNC_SWAP_ROUTER_JSON),
+    "SyncSwapClassicPair": json.loads(SYNC_SWAP_CLASSIC_PAIR_JSON),
+    "SyncSwapStablePair": json.loads(SYNC_SWAP_STABLE_PAIR_JSON),
+}
+ABI_BYTES: dict[str, bytes] = {
+    abi_name: json.dumps(abi, separators=(",", ":")).encode() for abi_name, abi in PARSED_ABIS.items()
+}
+
+
+@pytest.fixture(scope="session")
+def abi_files_dir(tmp_path_factory) -> dict[str, Path]:
+    """Writes each ABI JSON file once per session, returning a mapping of ABI name to absolute file path"""
+    abi_dir = tmp_path_factory.mktemp("abis")
+    abi_paths = {}
+    for abi_name, abi_bytes in ABI_BYTES.items():
+        abi_path = abi_dir / f"{abi_name}.json"
+        abi_path.write_bytes(abi_bytes)
+        abi_paths[abi_name] = abi_path
+
+    return abi_paths
+
 
 @pytest.fixture
 def cli_db_url(integration_db_url) -> List[str]:
     return ["--db-url", integration_db_url]
 
 
+@pytest.fixture(scope="module")
+def vcr_config() -> dict:
+    """
+    Cassette config for tests marked with ``vcr`` (requires pytest-recording).  JSON-RPC requests all POST to the same
+    URL, so requests are matched on their body as well.  Cassettes are stored in ``cassettes/<module_name>/``
+    """
+    return {
+        "match_on": ["method", "uri", "body"],
+        "filter_query_parameters": ["apikey"],
+    }
+
+
 @pytest.fixture()
 def eth_rpc_cli_config() -> List[str]:
     return [
         "--json-rpc",
         os.environ["ETH_JSON_RPC"],
+        "--max-concurrency",
+        "20",
     ]
 
 
@@ -36,66 +82,47 @@ def voyager_cli_config() -> List[str]:
 
 
 @pytest.fixture()
-def add_abis_to_db(cli_db_url):
+def add_abis_to_db(cli_db_url, abi_files_dir):
     def _add_abis(cli_runner: CliRunner):
         from nethermind.entro.cli import entro_cli
 
-        with cli_runner.isolated_filesystem():
-            with open("ERC20.json", "w") as f:
-                f.write(ERC20_ABI_JSON)
-            with open("ERC721.json", "w") as f:
-                f.write(ERC721_ABI_JSON)
-            with open("UniswapV3Pool.json", "w") as f:
-                f.write(UNISWAP_V3_POOL_JSON)
-            with open("UniswapV2Pair.json", "w") as f:
-                f.write(UNISWAP_V2_PAIR_JSON)
-
-            erc20_abi = cli_runner.invoke(
-                entro_cli,
-                [
-                    "add-abi",
-                    "ERC20",
-                    "ERC20.json",
-                    "--priority",
-                    "1000",
-                    *cli_db_url,
-                ],
-            )
-            assert erc20_abi.exit_code == 0
-            erc_721_abi = cli_runner.invoke(
-                entro_cli,
-                [
-                    "add-abi",
-                    "ERC721",
-                    "ERC721.json",
-                    "--priority",
-                    "1001",
-                    *cli_db_url,
-                ],
-            )
-            assert erc_721_abi.exit_code == 0
-            uni_v2_abi = cli_runner.invoke(
-                entro_cli,
-                [
-                    "add-abi",
-                    "UniswapV2Pair",
-                    "UniswapV2Pair.json",
-                    "--priority",
-                    "919",
-                    *cli_db_url,
-                ],
-            )
-            assert uni_v2_abi.exit_code == 0
-            uni_v3_abi = cli_runner.invoke(
-                entro_cli,
-                [
-                    "add-abi",
-                    "UniswapV3Pool",
-                    "UniswapV3Pool.json",
-                    "--priority",
-                    "920",
-                    *cli_db_url,
-                ],
-            )
+        add_abis_result = cli_runner.invoke(
+            entro_cli,
+            [
+                "decode",
+                "add-abis",
+                *["--abi", "ERC20", str(abi_files_dir["ERC20"]), "1000"],
+                *["--abi", "ERC721", str(abi_files_dir["ERC721"]), "1001"],
+                *["--abi", "UniswapV2Pair", str(abi_files_dir["UniswapV2Pair"]), "919"],
+                *["--abi", "UniswapV3Pool", str(abi_files_dir["UniswapV3Pool"]), "920"],
+                *cli_db_url,
+            ],
+        )
+        assert add_abis_result.exit_code == 0
 
     return _add_abis
+
+
+# ABI name -> decoder priority for the zkSync Era full block backfill
+ERA_ABI_PRIORITIES: dict[str, int] = {
+    "ERC20": 120,
+    "ERC721": 110,
+    "SyncSwapClassicPair": 100,
+    "SyncSwapStablePair": 90,
+    "SyncSwapRouter": 80,
+}
+
+
+@pytest.fixture()
+def add_era_abis_to_db(migrated_db, integration_db_session):
+    """Writes the zkSync Era ABIs directly through the ABI writer, committing all of them in a single transaction"""
+    from nethermind.entro.database.models.internal import ContractABI
+    from nethermind.entro.database.writers.internal import write_abis
+
+    write_abis(
+        [
+            ContractABI(abi_name=abi_name, abi_json=PARSED_ABIS[abi_name], priority=priority, decoder_os="EVM")
+            for abi_name, priority in ERA_ABI_PRIORITIES.items()
+        ],
+        integration_db_session,
+    )
@@ -1,11 +1,9 @@
 import uuid
 
 import pytest
-from click.testing import CliRunner
 
 from nethermind.entro.backfill.planner import BackfillPlan
 from nethermind.entro.cli import entro_cli
-from nethermind.entro.database.migrations import migrate_up
 from nethermind.entro.database.models import BackfilledRange
 from nethermind.entro.types.backfill import BackfillDataType, SupportedNetwork
 
@@ -19,7 +17,7 @@ DEFAULT_KWARGS = {
 
 
 @pytest.fixture(scope="function")
-def setup_backfills(integration_db_session, cli_db_url):
+def setup_backfills(migrated_db, integration_db_session, cli_db_url):
     backfills = [
         BackfilledRange(
             backfill_id=uuid.uuid4().hex,
@@ -34,9 +32,10 @@ def setup_backfills(integration_db_session, cli_db_url):
             **DEFAULT_KWARGS,
         ),
     ]
-    migrate_up(integration_db_session.get_bind())
 
-    integration_db_session.add_all(backfills)
+    # merge() keys on the (data_type, network, start_block, end_block) primary key, so re-running is idempotent
+    for backfill in backfills:
+        integration_db_session.merge(backfill)
     integration_db_session.commit()
 
 
@@ -77,13 +76,12 @@ def test_backfilling_start_at_end_at(
 def test_start_inside_end_inside(
     integration_postgres_db,
     integration_db_session,
+    cli_runner,
     cli_db_url,
     eth_rpc_cli_config,
     setup_backfills,
 ):
-    runner = CliRunner()
-
-    backfill_result = runner.invoke(
+    backfill_result = cli_runner.invoke(
         entro_cli,
         [
             "backfill",
@@ -110,9 +108,7 @@ def test_start_inside_end_inside(
     assert backfills[0].end_block == 18_000_080
 
 
-def test_extending_range_failed_backfill(integration_postgres_db, integration_db_session, eth_rpc_url):
-    migrate_up(integration_db_session.get_bind())
-
+def test_extending_range_failed_backfill(migrated_db, integration_db_session, eth_rpc_url):
     extend_id = uuid.uuid4().hex
     integration_db_session.add(
         BackfilledRange(
@@ -149,8 +145,7 @@ def test_extending_range_failed_backfill(integration_postgres_db, integration_db
     assert bfills[0].end_block == 16_000_000
 
 
-def test_multi_range_failed_backfills(integration_db_session, integration_db_url, eth_rpc_url):
-    migrate_up(integration_db_session.get_bind())
+def test_multi_range_failed_backfills(migrated_db, integration_db_session, integration_db_url, eth_rpc_url):
     conflict_id = uuid.uuid4().hex
     integration_db_session.add(
         BackfilledRange(
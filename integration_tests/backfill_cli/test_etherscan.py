@@ -1,5 +1,4 @@
 import pytest
-from click.testing import CliRunner
 
 from integration_tests.backfill_cli.utils import printout_error_and_traceback
 from nethermind.entro.cli import entro_cli
@@ -9,17 +8,13 @@ WETH_9 = "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"
 
 
 def test_backfill_ethereum_transactions(
-    integration_postgres_db,
+    migrated_db,
+    cli_runner,
     cli_db_url,
     etherscan_cli_config,
     integration_db_session,
 ):
-    runner = CliRunner()
-
-    migrate = runner.invoke(entro_cli, ["migrate-up", *cli_db_url])
-    assert migrate.exit_code == 0
-
-    transaction_backfill = runner.invoke(
+    transaction_backfill = cli_runner.invoke(
         entro_cli,
         [
             "backfill",
@@ -52,19 +47,14 @@ def test_backfill_ethereum_transactions(
 
 
 @pytest.mark.skip("Non-Critical")
-def test_required_parameters_for_etherscan_backfill(integration_postgres_db, cli_db_url, etherscan_cli_config):
-    runner = CliRunner()
-
-    migrate = runner.invoke(entro_cli, ["migrate-up", *cli_db_url])
-    assert migrate.exit_code == 0
-
-    no_api_key = runner.invoke(
+def test_required_parameters_for_etherscan_backfill(migrated_db, cli_runner, cli_db_url, etherscan_cli_config):
+    no_api_key = cli_runner.invoke(
         entro_cli,
         ["backfill", "ethereum", "transactions", "--for-address", WETH_9, *cli_db_url],
         input="y",
     )
 
-    invalid_api_key = runner.invoke(
+    invalid_api_key = cli_runner.invoke(
         entro_cli,
         [
             "backfill",
@@ -83,10 +73,3 @@ def test_required_parameters_for_etherscan_backfill(integration_postgres_db, cli
 
     assert str(invalid_api_key.exception) == "Etherscan API keys are 34 characters long.  Double check --api-key"
     assert str(no_api_key.exception) == "API key is required for Etherscan backfill"
-
-
-def test_backfill_all_txns_from_etherscan(
-    integration_postgres_db, etherscan_cli_config, cli_db_url, create_debug_logger
-):
-    pass
-    # Test rpc proxy functionality
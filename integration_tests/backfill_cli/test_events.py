@@ -3,9 +3,7 @@ import json
 import os
 from decimal import Decimal
 
-from click.testing import CliRunner
 from eth_utils import to_checksum_address
-from sqlalchemy import select
 
 from nethermind.entro.cli import entro_cli
 from nethermind.entro.database.models.uniswap import (
@@ -13,40 +11,26 @@ from nethermind.entro.database.models.uniswap import (
     UniV3CollectEvent,
     UniV3MintEvent,
 )
-from tests.resources.ABI import UNISWAP_V3_POOL_JSON
 
-from .utils import printout_error_and_traceback
+from .utils import head_tail_count, printout_error_and_traceback
 
 
 def test_backfill_mint_events_for_weth_wbtc_pool(
-    integration_postgres_db,
+    migrated_db,
     integration_db_session,
     cli_db_url,
     eth_rpc_cli_config,
+    cli_runner,
+    abi_files_dir,
     create_debug_logger,
 ):
-    runner = CliRunner()
-    migrate_res = runner.invoke(entro_cli, ["migrate-up", *cli_db_url])
-    assert migrate_res.exit_code == 0
-
-    with runner.isolated_filesystem():
-        with open("UniswapV3Pool.json", "w") as f:
-            f.write(UNISWAP_V3_POOL_JSON)
-
-        result = runner.invoke(
-            entro_cli,
-            [
-                "decode",
-                "add-abi",
-                "UniswapV3Pool",
-                "UniswapV3Pool.json",
-                *cli_db_url,
-            ],
-        )
-
-        assert result.exit_code == 0
-
-    mint_backfill_result = runner.invoke(
+    result = cli_runner.invoke(
+        entro_cli,
+        ["decode", "add-abi", "UniswapV3Pool", str(abi_files_dir["UniswapV3Pool"]), *cli_db_url],
+    )
+    assert result.exit_code == 0
+
+    mint_backfill_result = cli_runner.invoke(
         entro_cli,
         [
             "backfill",
@@ -85,42 +69,38 @@ def test_backfill_mint_events_for_weth_wbtc_pool(
     for line in expected_output:
         assert line in mint_backfill_result.output
 
-    mint_events = integration_db_session.execute(select(UniV3MintEvent)).scalars().all()
-    assert mint_events[0].sender == "0xC36442b4a4522E871399CD717aBDD847Ab11FE88"
+    first_mint, last_mint, mint_count = head_tail_count(
+        integration_db_session, UniV3MintEvent, UniV3MintEvent.block_number, UniV3MintEvent.event_index
+    )
+    assert first_mint.sender == "0xC36442b4a4522E871399CD717aBDD847Ab11FE88"
 
-    assert mint_events[0].amount == 32500065523907
-    assert mint_events[0].tickLower == 254220
-    assert mint_events[0].tickUpper == 258060
+    assert first_mint.amount == 32500065523907
+    assert first_mint.tickLower == 254220
+    assert first_mint.tickUpper == 258060
 
-    assert mint_events[-1].amount == 5108528917685
-    assert mint_events[-1].tickLower == 255480
-    assert mint_events[-1].tickUpper == 258900
+    assert last_mint.amount == 5108528917685
+    assert last_mint.tickLower == 255480
+    assert last_mint.tickUpper == 258900
 
-    assert len(mint_events) == 95
+    assert mint_count == 95
 
 
 def test_cli_backfill_multiple_events(
-    integration_postgres_db,
+    migrated_db,
     integration_db_session,
     cli_db_url,
     eth_rpc_cli_config,
+    cli_runner,
+    abi_files_dir,
     create_debug_logger,
 ):
-    runner = CliRunner()
-    runner.invoke(entro_cli, ["migrate-up", *cli_db_url])
-
-    with runner.isolated_filesystem():
-        with open("UniswapV3Pool.json", "w") as f:
-            f.write(UNISWAP_V3_POOL_JSON)
-
-        result = runner.invoke(
-            entro_cli,
-            ["decode", "add-abi", "UniswapV3Pool", "UniswapV3Pool.json", *cli_db_url],
-        )
-
-        assert result.exit_code == 0
+    result = cli_runner.invoke(
+        entro_cli,
+        ["decode", "add-abi", "UniswapV3Pool", str(abi_files_dir["UniswapV3Pool"]), *cli_db_url],
+    )
+    assert result.exit_code == 0
 
-    event_backfill_res = runner.invoke(
+    event_backfill_res = cli_runner.invoke(
         entro_cli,
         [
             "backfill",
@@ -157,38 +137,40 @@ def test_cli_backfill_multiple_events(
     for out in expected_out:
         assert out in event_backfill_res.output
 
-    mint_events = integration_db_session.execute(select(UniV3MintEvent)).scalars().all()
-    burn_events = integration_db_session.execute(select(UniV3BurnEvent)).scalars().all()
-    collect_events = integration_db_session.execute(select(UniV3CollectEvent)).scalars().all()
+    first_mint, last_mint, mint_count = head_tail_count(
+        integration_db_session, UniV3MintEvent, UniV3MintEvent.block_number, UniV3MintEvent.event_index
+    )
+    first_burn, last_burn, burn_count = head_tail_count(
+        integration_db_session, UniV3BurnEvent, UniV3BurnEvent.block_number, UniV3BurnEvent.event_index
+    )
+    _, last_collect, collect_count = head_tail_count(
+        integration_db_session, UniV3CollectEvent, UniV3CollectEvent.block_number, UniV3CollectEvent.event_index
+    )
 
     assert event_backfill_res.exit_code == 0
 
-    assert len(mint_events) == 6
-    assert len(burn_events) == 7
-    assert len(collect_events) == 8
-
-    assert mint_events[0].tickLower == 250920
-    assert mint_events[0].tickUpper == 264780
+    assert mint_count == 6
+    assert burn_count == 7
+    assert collect_count == 8
 
-    assert mint_events[-1].tickLower == 251280
-    assert mint_events[-1].tickUpper == 264360
+    assert first_mint.tickLower == 250920
+    assert first_mint.tickUpper == 264780
 
-    assert burn_events[0].tickLower == 255960
-    assert burn_events[0].tickUpper == 258300
+    assert last_mint.tickLower == 251280
+    assert last_mint.tickUpper == 264360
 
-    assert burn_events[-1].tickLower == collect_events[-1].tickLower == 251280
-    assert burn_events[-1].tickUpper == collect_events[-1].tickUpper == 264360
+    assert first_burn.tickLower == 255960
+    assert first_burn.tickUpper == 258300
 
-    assert burn_events[-1].amount0 == collect_events[-1].amount0 == Decimal("398206")
-    assert burn_events[-1].amount1 == collect_events[-1].amount1 == Decimal("63404179018897713")
+    assert last_burn.tickLower == last_collect.tickLower == 251280
+    assert last_burn.tickUpper == last_collect.tickUpper == 264360
 
+    assert last_burn.amount0 == last_collect.amount0 == Decimal("398206")
+    assert last_burn.amount1 == last_collect.amount1 == Decimal("63404179018897713")
 
-def test_event_cli_required_params(integration_postgres_db, integration_db_session, cli_db_url):
-    runner = CliRunner()
 
-    runner.invoke(entro_cli, ["migrate-up", *cli_db_url])
-
-    missing_contract_address = runner.invoke(
+def test_event_cli_required_params(migrated_db, cli_runner, cli_db_url):
+    missing_contract_address = cli_runner.invoke(
         entro_cli,
         [
             "backfill",
@@ -202,7 +184,7 @@ def test_event_cli_required_params(integration_postgres_db, integration_db_sessi
         ],
     )
 
-    missing_abi_name = runner.invoke(
+    missing_abi_name = cli_runner.invoke(
         entro_cli,
         [
             "backfill",
@@ -216,7 +198,7 @@ def test_event_cli_required_params(integration_postgres_db, integration_db_sessi
         ],
     )
 
-    invalid_abi = runner.invoke(
+    invalid_abi = cli_runner.invoke(
         entro_cli,
         [
             "backfill",
@@ -242,56 +224,58 @@ def test_event_cli_required_params(integration_postgres_db, integration_db_sessi
     assert "not present in Cache: InvalidABI" in invalid_abi.output
 
 
-def test_backfill_starknet_swaps(starknet_rpc_url):
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        abi_result = runner.invoke(
-            entro_cli,
-            [
-                "decode",
-                "add-class",
-                "AVNU-Exchange",
-                "0x07b33a07ec099c227130ddffc9d74ad813fbcb8e0ff1c0f3ce097958e3dfc70b",
-                "--priority=40",
-                f"--json-rpc={starknet_rpc_url}",
-            ],
-        )
-
-        assert abi_result.exit_code == 0
-
-        backfill_result = runner.invoke(
-            entro_cli,
-            [
-                "backfill",
-                "starknet",
-                "events",
-                "--contract-address=0x04270219d365d6b017231b52e92b3fb5d7c8378b05e9abc97724537a80e93b0f",
-                "--event-name=Swap",
-                "-abi=AVNU-Exchange",
-                f"--json-rpc={starknet_rpc_url}",
-                "--from-block=600000",
-                "--to-block=601000",
-                "--event-file=swap_events.csv",
-            ],
-            input="y",
-        )
-
-        printout_error_and_traceback(backfill_result)
-
-        assert backfill_result.exit_code == 0
-
-        with open("swap_events.csv", "rt") as read_file:
-            csv_reader = csv.reader(read_file, delimiter="|")
-
-            swap_events = list(csv_reader)
-
-        assert len(swap_events) == 8389
-
-        assert swap_events[1][0] == "600000"
-        assert swap_events[1][7] == "Swap"
-        assert json.loads(swap_events[1][8])["buy_amount"] == 6953719595
-
-        assert swap_events[-1][0] == "600990"
-        assert swap_events[-1][7] == "Swap"
-        assert json.loads(swap_events[-1][8])["buy_amount"] == 4546691991
+def test_backfill_starknet_swaps(cli_runner, starknet_rpc_url, tmp_path):
+    event_file = tmp_path / "swap_events.csv"
+
+    abi_result = cli_runner.invoke(
+        entro_cli,
+        [
+            "decode",
+            "add-class",
+            "AVNU-Exchange",
+            "0x07b33a07ec099c227130ddffc9d74ad813fbcb8e0ff1c0f3ce097958e3dfc70b",
+            "--priority=40",
+            f"--json-rpc={starknet_rpc_url}",
+        ],
+    )
+
+    assert abi_result.exit_code == 0
+
+    backfill_result = cli_runner.invoke(
+        entro_cli,
+        [
+            "backfill",
+            "starknet",
+            "events",
+            "--contract-address=0x04270219d365d6b017231b52e92b3fb5d7c8378b05e9abc97724537a80e93b0f",
+            "--event-name=Swap",
+            "-abi=AVNU-Exchange",
+            f"--json-rpc={starknet_rpc_url}",
+            "--from-block=600000",
+            "--to-block=601000",
+            f"--event-file={event_file}",
+        ],
+        input="y",
+    )
+
+    printout_error_and_traceback(backfill_result)
+
+    assert backfill_result.exit_code == 0
+
+    # Stream the CSV, keeping only the first event, the last event and the row count
+    first_swap, last_swap, row_count = None, None, 0
+    with open(event_file, "rt") as read_file:
+        for row_count, row in enumerate(csv.reader(read_file, delimiter="|"), start=1):
+            if row_count == 2:  # First row is the header
+                first_swap = row
+            last_swap = row
+
+    assert row_count == 8389
+
+    assert first_swap[0] == "600000"
+    assert first_swap[7] == "Swap"
+    assert json.loads(first_swap[8])["buy_amount"] == 6953719595
+
+    assert last_swap[0] == "600990"
+    assert last_swap[7] == "Swap"
+    assert json.loads(last_swap[8])["buy_amount"] == 4546691991
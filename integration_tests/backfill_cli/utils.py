@@ -1,6 +1,9 @@
 import traceback
+from typing import Any
 
 from click.testing import Result
+from sqlalchemy import func, select
+from sqlalchemy.orm import InstrumentedAttribute, Session
 
 
 def printout_error_and_traceback(invocation_result: Result):
@@ -11,3 +14,19 @@ def printout_error_and_traceback(invocation_result: Result):
     print(f"Exception Class:  {exception_class}")
     print(f"Exception:  {exception}")
     print(f"Output:  {invocation_result.output}")
+
+
+def head_tail_count(session: Session, model: Any, *order_cols: InstrumentedAttribute) -> tuple[Any, Any, int]:
+    """
+    Returns the first row, last row, and row count of a table without loading every row into the session.
+
+    :param session: Database session
+    :param model: ORM model to query
+    :param order_cols: Columns defining the row order, typically the primary key columns
+    :return: (first_row, last_row, row_count)
+    """
+    first = session.execute(select(model).order_by(*[col.asc() for col in order_cols]).limit(1)).scalar_one()
+    last = session.execute(select(model).order_by(*[col.desc() for col in order_cols]).limit(1)).scalar_one()
+    count = session.execute(select(func.count()).select_from(model)).scalar_one()
+
+    return first, last, count
@@ -1,16 +1,16 @@
-from dataclasses import asdict
+from dataclasses import replace
 
-from nethermind.entro.backfill.exporters import db_encode_dataclass
-from nethermind.entro.database.migrations import migrate_up
+from nethermind.entro.backfill.exporters import (
+    db_encode_dataclass,
+    db_encode_dataclasses,
+)
 from nethermind.entro.database.models.ethereum import Block as BlockModel
 from nethermind.entro.database.models.ethereum import Transaction as TransactionModel
 from nethermind.idealis.types.ethereum import Block, Transaction
 from nethermind.idealis.utils import to_bytes
 
 
-def test_block(integration_db_session):
-    migrate_up(integration_db_session.get_bind())
-
+def test_block(migrated_db, integration_db_session):
     test_block = Block(
         block_number=16592887,
         block_hash=to_bytes("0x7de9c923b2eab68a6a750fbe321638387911e9d02bda4671fa89e38999adbab1"),
@@ -38,9 +38,7 @@ def test_block(integration_db_session):
     assert db_block.block_number == 16592887
 
 
-def test_transaction(integration_db_session):
-    migrate_up(integration_db_session.get_bind())
-
+def test_transaction(migrated_db, integration_db_session):
     test_tx = Transaction(
         block_number=0xDC10DA,
         transaction_index=0,
@@ -75,3 +73,32 @@ def test_transaction(integration_db_session):
     )
 
     assert db_tx is not None
+
+
+def test_block_batch(migrated_db, integration_db_session):
+    base_block = Block(
+        block_number=16592887,
+        block_hash=to_bytes("0x7de9c923b2eab68a6a750fbe321638387911e9d02bda4671fa89e38999adbab1"),
+        difficulty=0,
+        extra_data=to_bytes("0x506f776572656420627920626c6f58726f757465"),
+        gas_limit=30000000,
+        gas_used=29961996,
+        miner=to_bytes("0x388c818ca8b9251b393131c08a736a67ccb19297"),
+        nonce=to_bytes("0x0000000000000000"),
+        parent_hash=to_bytes("0x6f207bcfe8afb73f9b21fc8bb2ad36724d4f46aedf63bc6f0341002688493c99"),
+        size=25888,
+        state_root=to_bytes("0x51b6d009dbd487d279a2efdc3385ef38cec4124e5a700da200d01062fad3bb16"),
+        timestamp=1675966139,
+        total_difficulty=58750003716598352816469,
+        base_fee_per_gas=77550695617,
+    )
+    test_blocks = [replace(base_block, block_number=base_block.block_number + offset) for offset in range(5)]
+
+    encoded_blocks = db_encode_dataclasses(test_blocks)
+
+    assert encoded_blocks == [db_encode_dataclass(block) for block in test_blocks]
+
+    integration_db_session.bulk_save_objects([BlockModel(**encoded) for encoded in encoded_blocks])
+    integration_db_session.commit()
+
+    assert integration_db_session.query(BlockModel).count() == 5
@@ -1,16 +1,15 @@
 import dataclasses
-import importlib.util
-import inspect
-import os
-from pathlib import Path
+import functools
+import importlib
+import pkgutil
+from typing import NamedTuple
 
 import pytest
 import sqlalchemy
 
+import nethermind.entro.database.models as entro_models
 from nethermind.entro.database.models.base import Base
 
-PARENT_DIRECTORY = Path(__file__).parents[2]
-
 # List of DB Models which dont have idealis dataclasses defined
 SKIPPED_PYTHON_MODULES = [
     "nethermind.entro.database.models.prices",
@@ -18,64 +17,78 @@ SKIPPED_PYTHON_MODULES = [
     "nethermind.entro.database.models.uniswap",
 ]
 
-
-SKIPPED_FILES = [
-    "base.py",
-    "__init__.py",
-]
-
 # pylint: disable
 # mypy: ignore-errors
 
 
-def construct_import_path(file_path):
-    # Convert file path to import path
-    relative_path = os.path.relpath(file_path, PARENT_DIRECTORY)
+@functools.lru_cache(maxsize=None)
+def load_dataclass_module(module_path: str):
+    """Imports each idealis dataclass module once, regardless of how many models map to it"""
+    return importlib.import_module(module_path)
+
+
+def dataclass_fields_for_model(model_path: str) -> tuple[dataclasses.Field, ...]:
+    """Resolves the idealis dataclass a database model overrides, and returns its fields"""
+    dataclass_path = model_path.rsplit(".", 2)[1:-1]
+    dataclass_mod_path = f"nethermind.idealis.types." + ".".join(dataclass_path)
 
-    # replace / with . and remove .py
-    return relative_path.replace(os.sep, ".")[:-3]
+    db_model_name = model_path.rsplit(".", 1)[1]
+    if db_model_name.endswith("DefaultEvent"):
+        dataclass_search_name = "Event"
+    else:
+        dataclass_search_name = db_model_name
 
+    dataclass = getattr(load_dataclass_module(dataclass_mod_path), dataclass_search_name)
+    return dataclasses.fields(dataclass)
 
-def walk_directory(directory) -> list[str]:
-    """Walk through a directory and return model paths"""
-    model_paths = []
 
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if not file.endswith(".py") or file in SKIPPED_FILES:
-                continue
+class ModelCase(NamedTuple):
+    """Model columns and the fields of the idealis dataclass the model overrides"""
 
-            Base.metadata.clear()
-            file_path = os.path.join(root, file)
-            module_path = construct_import_path(file_path)
+    id: str
+    columns: tuple[sqlalchemy.Column, ...]
+    fields: tuple[dataclasses.Field, ...] | None
 
-            if module_path in SKIPPED_PYTHON_MODULES:
-                continue
 
-            try:
-                spec = importlib.util.spec_from_file_location(module_path, file_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)  # type: ignore
+@functools.cache
+def model_cases() -> tuple[ModelCase, ...]:
+    """
+    Returns a test case for each model mapped on Base.  Model modules are imported once, and the mapped classes
+    are read from the declarative registry.  Model columns and dataclass fields are resolved once at collection,
+    so the test cases only run assertions
+    """
+    for module_info in pkgutil.iter_modules(entro_models.__path__, prefix=f"{entro_models.__name__}."):
+        if module_info.name not in SKIPPED_PYTHON_MODULES:
+            importlib.import_module(module_info.name)
 
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if issubclass(obj, Base):
-                        if not hasattr(obj, "__tablename__"):
-                            continue  # Abstract classes dont have a __tablename__ defined
+    cases = []
 
-                        model_paths.append(f"{module_path}.{name}")
+    # Registry mappers are an unordered set.  Sort them so every xdist worker collects the same test order
+    model_classes = sorted(
+        (mapper.class_ for mapper in Base.registry.mappers), key=lambda c: (c.__module__, c.__name__)
+    )
+    for model_class in model_classes:
+        if not model_class.__module__.startswith(f"{entro_models.__name__}."):
+            continue
+        if model_class.__module__ in SKIPPED_PYTHON_MODULES:
+            continue
 
-            except Exception as e:
-                print(f"Could not import {module_path}: {e}")
+        model_path = f"{model_class.__module__}.{model_class.__name__}"
+        columns = tuple(col for key, col in model_class.__table__.columns.items() if not key.startswith("_"))
 
-    return model_paths
+        try:
+            fields = dataclass_fields_for_model(model_path)
+        except (ImportError, AttributeError) as e:
+            print(f"Could not load dataclass for {model_path}: {e}")
+            fields = None  # Reported as a failure by the test case
 
+        cases.append(ModelCase(model_path.replace(f"{entro_models.__name__}.", ""), columns, fields))
 
-model_paths = walk_directory(PARENT_DIRECTORY / "nethermind" / "entro" / "database" / "models")
-un_prefixed_models = [model_path.replace("nethermind.entro.database.models.", "") for model_path in model_paths]
+    return tuple(cases)
 
 
-@pytest.mark.parametrize("database_model", un_prefixed_models)
-def test_sqlalchemy_models_override_all_dataclass_fields(database_model):
+@pytest.mark.parametrize("case", model_cases(), ids=lambda case: case.id)
+def test_sqlalchemy_models_override_all_dataclass_fields(case: ModelCase):
     """
     Test that all dataclass fields in a SQLAlchemy model are overridden with SQLAlchemy types.
 
@@ -84,36 +97,8 @@ def test_sqlalchemy_models_override_all_dataclass_fields(database_model):
     fields have been overridden with sqlalchemy types, allowing dataclasses to be converted into models using
     db_model(**dataclasses.to_dict(dataclass)) syntax
     """
-    Base.metadata.clear()
-    database_model = f"nethermind.entro.database.models.{database_model}"
-
-    module_name, db_model_name = database_model.rsplit(".", 1)
-
-    spec = importlib.util.spec_from_file_location(
-        module_name, PARENT_DIRECTORY / f"{module_name.replace('.', os.sep)}.py"
-    )
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-
-    class_def = getattr(module, db_model_name)
-    database_model_columns: list[sqlalchemy.Column] = [
-        col for key, col in class_def.__table__.columns.items() if not key.startswith("_")
-    ]
-
-    dataclass_path = database_model.rsplit(".", 2)[1:-1]
-    dataclass_mod_path = f"nethermind.idealis.types." + ".".join(dataclass_path)
-
-    spec = importlib.util.find_spec(dataclass_mod_path)
-    dataclass_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(dataclass_module)
-
-    if db_model_name.endswith("DefaultEvent"):
-        dataclass_search_name = "Event"
-    else:
-        dataclass_search_name = db_model_name
-
-    dataclass = getattr(dataclass_module, dataclass_search_name)
-    fields = dataclasses.fields(dataclass)
+    fields, database_model_columns = case.fields, case.columns
+    assert fields is not None, "No idealis dataclass found for database model"
 
     print(f"Dataclass Fields: {fields}")
     print(f"Database Model Columns: {database_model_columns}")
@@ -1,5 +1,4 @@
 from nethermind.entro.backfill.exporters import db_encode_dataclass
-from nethermind.entro.database.migrations import migrate_up
 from nethermind.entro.database.models.starknet import Block as StarknetBlockModel
 from nethermind.entro.database.models.starknet import Transaction as TransactionModel
 from nethermind.idealis.types.starknet import Block, Transaction
@@ -12,9 +11,7 @@ from nethermind.idealis.types.starknet.enums import (
 from nethermind.idealis.utils import to_bytes
 
 
-def test_block(integration_db_session):
-    migrate_up(integration_db_session.get_bind())
-
+def test_block(migrated_db, integration_db_session):
     test_block = Block(
         block_number=623436,
         timestamp=1710916519,
@@ -42,9 +39,7 @@ def test_block(integration_db_session):
     assert db_block.block_number == 623436
 
 
-def test_transaction(integration_db_session):
-    migrate_up(integration_db_session.get_bind())
-
+def test_transaction(migrated_db, integration_db_session):
     test_tx = Transaction(
         transaction_hash=to_bytes("01139643045af8ad540f84685aad59115073f7aae58b1c46fd57cffdef438657"),
         block_number=100,
@@ -1,6 +1,7 @@
 import pytest
 from aiohttp import ClientSession
 
+from nethermind.entro.decoding.utils import felts_to_ints
 from nethermind.idealis.parse.starknet.trace import replace_delegate_calls_for_tx
 from nethermind.idealis.rpc.starknet.trace import trace_transaction
 from nethermind.idealis.utils import to_bytes
@@ -9,13 +10,12 @@ from nethermind.idealis.utils.starknet import PessimisticDecoder
 
 @pytest.mark.asyncio
 async def test_decode_tx_traces(starknet_rpc_url):
-    session = ClientSession()
-    tx_trace = await trace_transaction(
-        transaction_hash=to_bytes("0x044c8d0d48bbdfd1f062ba47337edf501a1b3beb65d8193d89102e0ab708d819"),
-        rpc_url=starknet_rpc_url,
-        aiohttp_session=session,
-    )
-    await session.close()
+    async with ClientSession() as session:
+        tx_trace = await trace_transaction(
+            transaction_hash=to_bytes("0x044c8d0d48bbdfd1f062ba47337edf501a1b3beb65d8193d89102e0ab708d819"),
+            rpc_url=starknet_rpc_url,
+            aiohttp_session=session,
+        )
 
     call_traces = replace_delegate_calls_for_tx(tx_trace.execute_traces)
 
@@ -23,8 +23,8 @@ async def test_decode_tx_traces(starknet_rpc_url):
 
     for trace in call_traces:
         decoded = class_decoder.decode_function(
-            calldata=[int.from_bytes(c, "big") for c in trace.calldata],
-            result=[int.from_bytes(r, "big") for r in trace.result],
+            calldata=felts_to_ints(trace.calldata),
+            result=felts_to_ints(trace.result),
             function_selector=trace.selector,
             class_hash=trace.class_hash,
         )
@@ -1,12 +1,8 @@
-from click.testing import CliRunner
-
 from nethermind.entro.cli import entro_cli
 
 
-def test_starknet_simple_txn(starknet_rpc_url):
-    runner = CliRunner()
-
-    result = runner.invoke(
+def test_starknet_simple_txn(cli_runner, starknet_rpc_url):
+    result = cli_runner.invoke(
         entro_cli,
         [
             "get",
@@ -35,10 +31,8 @@ def test_starknet_simple_txn(starknet_rpc_url):
         assert out in result.output
 
 
-def test_get_invalid_trace_txn(starknet_rpc_url):
-    runner = CliRunner()
-
-    result = runner.invoke(
+def test_get_invalid_trace_txn(cli_runner, starknet_rpc_url):
+    result = cli_runner.invoke(
         entro_cli,
         [
             "get",
@@ -46,8 +40,9 @@ def test_get_invalid_trace_txn(starknet_rpc_url):
             "transaction",
             "0x5d4f4be4095b0966a8e27f2c0e8bd1f818186a712610455334d78a1d379f470",
             "--json-rpc",
-            *starknet_rpc_url,
+            starknet_rpc_url,
         ],
     )
 
     assert result.exit_code == 2
+    assert "Invalid value for 'TRANSACTION_HASH': Could not trace transaction" in result.output
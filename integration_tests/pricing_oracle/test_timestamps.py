@@ -5,18 +5,14 @@ import click.utils
 
 from entro.backfill.timestamps import TimestampConverter
 from nethermind.entro.backfill.utils import get_current_block_number
-from nethermind.entro.database.migrations import migrate_up
 from nethermind.entro.types.backfill import SupportedNetwork
 
 
 def test_backfills_ethereum_timestamps(
-    integration_postgres_db,
-    integration_db_session,
+    migrated_db,
     integration_db_url,
     eth_rpc_url,
 ):
-    migrate_up(integration_db_session.get_bind())
-
     timestamp_converter = TimestampConverter(
         network=SupportedNetwork.ethereum,
         db_url=integration_db_url,
@@ -30,11 +26,7 @@ def test_backfills_ethereum_timestamps(
     assert len(timestamp_converter.timestamp_data) == (current_block // 100_000) + 1
 
 
-def test_ethereum_timestamp_conversions(
-    eth_rpc_url, integration_db_session, integration_db_url, integration_postgres_db
-):
-    migrate_up(integration_db_session.get_bind())
-
+def test_ethereum_timestamp_conversions(eth_rpc_url, integration_db_url, migrated_db):
     timestamp_converter = TimestampConverter(
         network=SupportedNetwork.ethereum,
         db_url=integration_db_url,
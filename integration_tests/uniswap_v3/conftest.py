@@ -13,7 +13,7 @@ from tests.resources.addresses import (
 uni_v3_abi = json.loads(UNISWAP_V3_POOL_JSON)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def usdc_weth_contract(eth_archival_w3):
     return eth_archival_w3.eth.contract(
         address=USDC_WETH_UNI_V3_POOL,
@@ -21,7 +21,7 @@ def usdc_weth_contract(eth_archival_w3):
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def wbtc_weth_contract(eth_archival_w3):
     return eth_archival_w3.eth.contract(
         address=WBTC_WETH_UNI_V3_POOL,
@@ -29,7 +29,7 @@ def wbtc_weth_contract(eth_archival_w3):
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def usdt_weth_contract(eth_archival_w3):
     return eth_archival_w3.eth.contract(
         address=USDT_WETH_UNI_V3_POOL,
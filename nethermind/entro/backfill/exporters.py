@@ -1,13 +1,17 @@
-import json
+import csv
+import itertools
 import logging
+import operator
 import os.path
 import time
 from abc import abstractmethod
+from collections import ChainMap
+from dataclasses import fields, is_dataclass
 from enum import Enum
-from typing import Any, Type
+from types import NoneType, UnionType
+from typing import Any, Callable, Type, Union, get_args, get_origin, get_type_hints
 
-from sqlalchemy import Connection, Engine
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import Connection, Engine, inspect
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from nethermind.entro.database.models import (
@@ -18,14 +22,15 @@ from nethermind.entro.database.models import (
     transfer_model_for_network,
 )
 from nethermind.entro.database.models.uniswap import UNI_EVENT_MODELS
+from nethermind.entro.database.writers.utils import bulk_insert
 from nethermind.entro.exceptions import BackfillError
 from nethermind.entro.types.backfill import (
     BackfillDataType,
     Dataclass,
     ExporterDataType,
     SupportedNetwork,
-    dataclass_as_dict,
 )
+from nethermind.entro.utils import json_dumps
 from nethermind.idealis.utils import to_hex
 
 root_logger = logging.getLogger("nethermind")
@@ -36,6 +41,27 @@ ALL_EVENT_MODELS: dict[bytes, Type[DeclarativeBase]] = {
     **UNI_EVENT_MODELS,
 }
 
+# Write buffer of CSV export files, so rows from consecutive batches are coalesced into fewer write syscalls
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+# Field names of each exported dataclass type, resolved once instead of walking fields() for every row
+_DATACLASS_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+# attrgetter returning the field values of each exported dataclass type as a tuple, in field order
+_DATACLASS_FIELD_GETTERS: dict[type, Callable[[Any], tuple[Any, ...]]] = {}
+
+# Returns the signature (first key or topic) of each exported event dataclass type
+_EVENT_SIGNATURE_GETTERS: dict[type, Callable[[Any], bytes | None]] = {}
+
+# Default event fields that are copied onto custom event models
+CUSTOM_EVENT_MODEL_FIELDS = ("block_number", "transaction_index", "event_index", "contract_address")
+
+# Values returned unchanged by db_json_encode.  Matched on exact type, skipping the isinstance() MRO walk
+_JSON_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# Generated db_encode_dataclass function for each exported dataclass type
+_DB_ENCODERS: dict[type, Callable[[Any], dict[str, Any]]] = {}
+
 # pylint: disable=invalid-name
 
 
@@ -61,6 +87,7 @@ class IntegrityMode(Enum):
     fail = "fail"
 
 
+# pylint: disable=too-many-return-statements
 def db_json_encode(data: Any) -> Any:
     """
     Recursively encodes a dictionary or list.  Converts all binary types to hexstrings that can be saved to
@@ -69,6 +96,20 @@ def db_json_encode(data: Any) -> Any:
     :param data:
     :return:
     """
+    data_type = type(data)
+    if data_type in _JSON_SCALAR_TYPES:
+        return data
+
+    if data_type is dict:
+        return {k: db_json_encode(v) for k, v in data.items()}
+
+    if data_type is list or data_type is tuple:
+        return [db_json_encode(d) for d in data]
+
+    if data_type is bytes:
+        return "0x" + data.hex()
+
+    # Subclasses (HexBytes, IntEnum, OrderedDict, ...) fall through to the isinstance checks
     if isinstance(data, dict):
         return {k: db_json_encode(v) for k, v in data.items()}
 
@@ -81,9 +122,70 @@ def db_json_encode(data: Any) -> Any:
     if isinstance(data, bytes):
         return "0x" + data.hex()
 
+    if is_dataclass(data) and not isinstance(data, type):
+        return {k: db_json_encode(v) for k, v in dataclass_items(data)}
+
     return data
 
 
+def dataclass_field_names(dataclass_type: type) -> tuple[str, ...]:
+    """
+    Returns the field names of a dataclass type, in field order.  Names are cached per dataclass type.
+
+    :param dataclass_type: Dataclass type
+    """
+    try:
+        return _DATACLASS_FIELD_NAMES[dataclass_type]
+    except KeyError:
+        field_names = _DATACLASS_FIELD_NAMES[dataclass_type] = tuple(f.name for f in fields(dataclass_type))
+        return field_names
+
+
+def dataclass_values(dataclass: Dataclass) -> tuple[Any, ...]:
+    """
+    Returns the field values of a dataclass as a tuple, in field order.  Values are read with an attrgetter that is
+    cached per dataclass type.
+
+    :param dataclass: Dataclass instance
+    """
+    dataclass_type = type(dataclass)
+    try:
+        getter = _DATACLASS_FIELD_GETTERS[dataclass_type]
+    except KeyError:
+        field_names = dataclass_field_names(dataclass_type)
+        if len(field_names) == 1:  # attrgetter only returns a tuple when passed multiple attributes
+            single_getter = operator.attrgetter(field_names[0])
+
+            def getter(obj: Any) -> tuple[Any, ...]:
+                return (single_getter(obj),)
+
+            _DATACLASS_FIELD_GETTERS[dataclass_type] = getter
+        else:
+            getter = _DATACLASS_FIELD_GETTERS[dataclass_type] = operator.attrgetter(*field_names)
+
+    return getter(dataclass)
+
+
+def dataclass_items(dataclass: Dataclass) -> list[tuple[str, Any]]:
+    """
+    Returns the (field name, value) pairs of a dataclass.  Unlike dataclasses.asdict(), values are not deep-copied,
+    and the field names are cached per dataclass type.
+
+    :param dataclass: Dataclass instance
+    """
+    return list(zip(dataclass_field_names(type(dataclass)), dataclass_values(dataclass)))
+
+
+def shallow_asdict(dataclass: Dataclass) -> dict[str, Any]:
+    """
+    Shallow alternative to dataclasses.asdict().  Nested dataclasses, lists and dicts are returned as-is instead of
+    being recursively copied.
+
+    :param dataclass: Dataclass instance
+    """
+    return dict(dataclass_items(dataclass))
+
+
 # TODO: Refactor this to not be a steaming pile of primary school garbage :facepalm:
 def encode_val(obj: Any, csv_out: bool = False, hex_encode_bytes: bool = True, json_dump: bool = True) -> Any:
     """Encode a dataclass dictionary into a format that can be passed to a Sqlalchemy model or written as CSV"""
@@ -95,8 +197,8 @@ def encode_val(obj: Any, csv_out: bool = False, hex_encode_bytes: bool = True, j
         return str(obj)
 
     if isinstance(obj, (list, tuple, dict)):
-        if json_dump:  # If writing to CSV, json.dumps the object
-            return json.dumps(db_json_encode(obj))
+        if json_dump:  # If writing to CSV, JSON encode the object
+            return json_dumps(db_json_encode(obj))
 
         # If writing to sqlalchemy, it auto-calls JSON.dumps on the dict obj
         return db_json_encode(obj)
@@ -107,17 +209,143 @@ def encode_val(obj: Any, csv_out: bool = False, hex_encode_bytes: bool = True, j
     if isinstance(obj, Enum):
         return obj.name
 
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return encode_val(shallow_asdict(obj), csv_out, hex_encode_bytes, json_dump)
+
     return obj
 
 
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+def _json_encode_csv(value: Any) -> str:
+    return json_dumps(db_json_encode(value))
+
+
+# encode_val() results for the common value types, looked up by exact type instead of running its isinstance chain.
+# Values of any other type (subclasses, enums, nested dataclasses) fall back to encode_val()
+_DB_VALUE_ENCODERS: dict[type, Callable[[Any], Any]] = {
+    **dict.fromkeys((str, int, float, bool, type(None)), _passthrough),
+    **dict.fromkeys((list, tuple, dict), db_json_encode),
+    bytes: to_hex,
+}
+
+# csv.writer writes None as an empty field and str()'s numbers, matching encode_val(csv_out=True)
+_CSV_VALUE_ENCODERS: dict[type, Callable[[Any], Any]] = {
+    **_DB_VALUE_ENCODERS,
+    **dict.fromkeys((list, tuple, dict), _json_encode_csv),
+}
+
+
+def _encode_db_val(value: Any) -> Any:
+    encoder = _DB_VALUE_ENCODERS.get(type(value))
+    if encoder is None:
+        return encode_val(value, hex_encode_bytes=True, json_dump=False)
+    return encoder(value)
+
+
+def _encode_csv_val(value: Any) -> Any:
+    encoder = _CSV_VALUE_ENCODERS.get(type(value))
+    if encoder is None:
+        return encode_val(value, csv_out=True, hex_encode_bytes=True)
+    return encoder(value)
+
+
+# Generated field encoders only trust the type hint when the value matches it.  Values that don't match (ie, bytes
+# in a str field) are encoded by _encode_db_val, so the output always matches encode_val()
+
+
+def _encode_scalar(value: Any) -> Any:
+    return value if type(value) in _JSON_SCALAR_TYPES else _encode_db_val(value)
+
+
+def _encode_bytes(value: Any) -> Any:
+    return to_hex(value) if isinstance(value, bytes) else _encode_db_val(value)
+
+
+def _encode_enum(value: Any) -> Any:
+    return value.name if isinstance(value, Enum) else _encode_db_val(value)
+
+
+def _field_encoder_name(field_type: Any) -> str:
+    """
+    Selects the encoder for a dataclass field from its type hint, falling back to the generic _encode_db_val for
+    anything that can't be narrowed to a single type.
+    """
+    if get_origin(field_type) in (Union, UnionType):
+        field_types = [typ for typ in get_args(field_type) if typ is not NoneType]
+        if len(field_types) != 1:
+            return "_encode_db_val"
+        field_type = field_types[0]
+
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        return "_encode_enum"
+    if field_type in (int, str, float, bool):
+        return "_encode_scalar"
+    if field_type is bytes:
+        return "_encode_bytes"
+    return "_encode_db_val"
+
+
+def _build_db_encoder(dataclass_type: type) -> Callable[[Any], dict[str, Any]]:
+    """
+    Generates a straight-line encoding function for a dataclass type, resolving the encoder for each field from
+    its type hint once, instead of dispatching on the type of every value for every row.
+
+    :param dataclass_type: Dataclass type to generate the encoder for
+    """
+    try:
+        type_hints = get_type_hints(dataclass_type)
+    except Exception:  # pylint: disable=broad-exception-caught
+        type_hints = {}  # Unresolvable forward references are encoded with encode_val
+
+    dict_items = []
+    for field in fields(dataclass_type):
+        encoder_name = _field_encoder_name(type_hints.get(field.name, Any))
+        dict_items.append(f"{field.name!r}: {encoder_name}(dataclass.{field.name})")
+
+    encoder_source = f"def _db_encode(dataclass):\n    return {{{', '.join(dict_items)}}}\n"
+    encoder_globals = {
+        "_encode_scalar": _encode_scalar,
+        "_encode_bytes": _encode_bytes,
+        "_encode_enum": _encode_enum,
+        "_encode_db_val": _encode_db_val,
+    }
+    exec(encoder_source, encoder_globals)  # pylint: disable=exec-used
+
+    return encoder_globals["_db_encode"]
+
+
+def _get_db_encoder(dataclass_type: type) -> Callable[[Any], dict[str, Any]]:
+    try:
+        return _DB_ENCODERS[dataclass_type]
+    except KeyError:
+        encoder = _DB_ENCODERS[dataclass_type] = _build_db_encoder(dataclass_type)
+        return encoder
+
+
 def db_encode_dataclass(dataclass: Dataclass) -> dict[str, Any]:
     """
     Encode a dataclass dictionary into a format that can be passed to a Sqlalchemy model
     :param dataclass: Dataclass to encode
     """
-    dataclass_dict = dataclass_as_dict(dataclass)
+    return _get_db_encoder(type(dataclass))(dataclass)
+
+
+def db_encode_dataclasses(dataclasses: list[Dataclass]) -> list[dict[str, Any]]:
+    """
+    Encodes a batch of dataclasses into dictionaries that can be passed to Sqlalchemy models.  The encoder is
+    resolved once for each run of dataclasses with the same type, instead of once per dataclass
 
-    return {k: encode_val(v, hex_encode_bytes=True, json_dump=False) for k, v in dataclass_dict.items()}
+    :param dataclasses: Dataclasses to encode
+    """
+    encoded: list[dict[str, Any]] = []
+    for dataclass_type, batch in itertools.groupby(dataclasses, key=type):
+        encoder = _get_db_encoder(dataclass_type)
+        encoded.extend(encoder(dataclass) for dataclass in batch)
+
+    return encoded
 
 
 class AbstractResourceExporter:
@@ -127,6 +355,8 @@ class AbstractResourceExporter:
     export_data_type: ExporterDataType
     init_time: float
     resources_saved: int = 0
+    concurrent_writes: bool = False
+    """ If True, the exporter can write in a worker thread while the backfill's other exporters write """
 
     def __init__(self, export_data_type: ExporterDataType):
         self.init_time = time.time()
@@ -161,33 +391,41 @@ class FileResourceExporter(AbstractResourceExporter):
 
         self.export_mode = ExportMode.csv
         self.file_name = file_name
-        self.file_handle = open(file_name, "at" if append else "wt")  # pylint: disable=consider-using-with
+        self.file_handle = open(  # pylint: disable=consider-using-with
+            file_name, "at" if append else "wt", buffering=CSV_WRITE_BUFFER_SIZE, newline=""
+        )
+        self.csv_writer = csv.writer(self.file_handle, delimiter=self.csv_separator, lineterminator="\n")
         file_size = os.path.getsize(file_name)
         if file_size == 0:
             self.write_headers = True
 
-    def _encode_dataclass(self, dataclass: Dataclass) -> tuple[list[str], str]:
-        dataclass_dict = dataclass_as_dict(dataclass)
-
-        csv_encoded = [encode_val(val, csv_out=True, hex_encode_bytes=True) for val in dataclass_dict.values()]
+    @staticmethod
+    def _encode_dataclass(dataclass: Dataclass) -> list[Any]:
+        # csv.writer str()'s any value encode_val passes through (Decimal, datetime, ...)
+        return list(map(_encode_csv_val, dataclass_values(dataclass)))
 
-        if self.export_mode == ExportMode.csv:
-            return list(dataclass_dict.keys()), self.csv_separator.join(csv_encoded)
+    def write(self, resources: list[Dataclass]):
+        if not resources:
+            return
 
-        raise NotImplementedError(f"Export Mode {self.export_mode} is not implemented")
+        if self.export_mode != ExportMode.csv:
+            raise NotImplementedError(f"Export Mode {self.export_mode} is not implemented")
 
-    def write(self, resources: list[Dataclass]):
-        # TODO: Optimize the CSV encoding disaster...
-        for resource in resources:
-            headers, csv_row = self._encode_dataclass(resource)
-            if self.write_headers:
-                self.file_handle.write(self.csv_separator.join(headers) + "\n")
-                self.write_headers = False
+        if self.write_headers:
+            self.csv_writer.writerow(dataclass_field_names(type(resources[0])))
+            self.write_headers = False
 
-            self.file_handle.write(csv_row + "\n")
+        # csv.writer joins & quotes rows in C.  Values containing the separator, quotes or newlines are quoted
+        self.csv_writer.writerows(map(self._encode_dataclass, resources))
 
         self.resources_saved += len(resources)
 
+    def close(self):
+        """Flush buffered rows & close the export file"""
+        super().close()
+
+        self.file_handle.close()
+
 
 class DBResourceExporter(AbstractResourceExporter):
     """Export Dataclasses to a Database.  Performs Necessary Dataclass -> ORM Model Conversion & Encoding"""
@@ -203,6 +441,10 @@ class DBResourceExporter(AbstractResourceExporter):
     engine: Engine | Connection
     session: Session
     dialect: str
+    model_attributes: set[str]
+    """ Column attribute names of the default model """
+    checked_dataclass_types: set[type]
+    """ Dataclass types whose fields have been checked against the default model """
 
     def __init__(
         self,
@@ -218,37 +460,49 @@ class DBResourceExporter(AbstractResourceExporter):
         self.integrity_mode = IntegrityMode(integrity_mode)
         self.session = sessionmaker(self.engine)()
         self.dialect = self.engine.dialect.name
+        self.model_attributes = {attr.key for attr in inspect(default_model).column_attrs}
+        self.checked_dataclass_types = set()
 
-    def _insert_models(self, db_models: list[DeclarativeBase]):
-        match self.integrity_mode:  # TODO: Clean up this dumpster-fire
-            case IntegrityMode.ignore:
-                self.session.bulk_save_objects(db_models, update_changed_only=True)
-            case IntegrityMode.overwrite:
-                self.session.bulk_save_objects(db_models)
-            case IntegrityMode.fail:
-                self.session.bulk_save_objects(db_models)
-            case _:
-                raise NotImplementedError
+        # Each exporter writes through its own session, so exporters can insert into their tables concurrently when
+        # they check out separate pooled connections.  A shared Connection or a sqlite database can't be written to
+        # from several threads at once
+        self.concurrent_writes = isinstance(self.engine, Engine) and self.dialect != "sqlite"
+
+    def _insert_rows(self, rows_by_model: dict[Type[DeclarativeBase], list[dict[str, Any]]]):
+        """
+        Writes encoded rows with one multi-row INSERT per table, using ON CONFLICT to apply the integrity_mode.
+        EventExporter batches can span several event tables.  On psycopg2, the engine from create_db_engine pages the
+        INSERT into multi-row VALUES statements, like execute_values()
+        """
+        for model_type, rows in rows_by_model.items():
+            bulk_insert(self.session, model_type, rows, on_conflict=self.integrity_mode.value)
 
         self.session.commit()
 
+    def _check_dataclass_fields(self, resources: list[Dataclass]):
+        """
+        Raises a BackfillError if a dataclass has fields that are not columns of the default model.  Encoded rows are
+        written without instantiating ORM models, so fields are checked once per dataclass type instead
+        """
+        for dataclass_type in {type(resource) for resource in resources} - self.checked_dataclass_types:
+            unmapped_fields = set(dataclass_field_names(dataclass_type)) - self.model_attributes
+            if unmapped_fields:
+                logger.error(
+                    f"Error encoding dataclass to {self.default_model}.  {dataclass_type.__name__} fields "
+                    f"{sorted(unmapped_fields)} are not mapped on the model"
+                )
+                raise BackfillError("Error encoding dataclass to ORM model")
+            self.checked_dataclass_types.add(dataclass_type)
+
     def write(self, resources: list[Dataclass]):
         """
-        Writes a list of dataclasses to the database.  Dataclasses are converted to ORM models, and added to a buffer
+        Writes a list of dataclasses to the database.  Dataclasses are encoded to rows of the default model, and
+        inserted without instantiating ORM models
         :return:
         """
+        self._check_dataclass_fields(resources)
 
-        db_models = []
-
-        for resource in resources:
-            encoded_dataclass = db_encode_dataclass(resource)
-            try:
-                db_models.append(self.default_model(**encoded_dataclass))
-            except BaseException:
-                logger.error(f"Error encoding dataclass to {self.default_model}.  Dataclass: {encoded_dataclass}")
-                raise BackfillError("Error encoding dataclass to ORM model")
-
-        self._insert_models(db_models)
+        self._insert_rows({self.default_model: db_encode_dataclasses(resources)})
         self.resources_saved += len(resources)
 
     def close(self):
@@ -260,13 +514,47 @@ class DBResourceExporter(AbstractResourceExporter):
         self.session.close()
 
 
+def _first_key(event: Any) -> bytes:
+    return event.keys[0]
+
+
+def _first_topic(event: Any) -> bytes:
+    return event.topics[0]
+
+
+def _no_signature(_event: Any) -> None:
+    return None
+
+
+def _event_signature(event: Dataclass) -> bytes | None:
+    """
+    Returns the signature of an event dataclass.  Starknet events store the selector as the first key, and EVM
+    events as the first topic.  The attribute to read is resolved once per event dataclass type.
+    """
+    event_type = type(event)
+    try:
+        getter = _EVENT_SIGNATURE_GETTERS[event_type]
+    except KeyError:
+        if hasattr(event, "keys"):
+            getter = _EVENT_SIGNATURE_GETTERS[event_type] = _first_key
+        elif hasattr(event, "topics"):
+            getter = _EVENT_SIGNATURE_GETTERS[event_type] = _first_topic
+        else:
+            getter = _EVENT_SIGNATURE_GETTERS[event_type] = _no_signature
+
+    return getter(event)
+
+
 class EventExporter(DBResourceExporter):
     """
     Database interface for writing decoded events to the database
     """
 
     db_cache: dict[str, list[DeclarativeBase]]
-    event_model_mapping: dict[bytes, Type[DeclarativeBase]]
+    event_model_mapping: ChainMap[bytes, Type[DeclarativeBase]]
+    """ Custom event model for each event signature.  Overrides take priority over ALL_EVENT_MODELS """
+    row_builders: dict[bytes, Callable[[Dataclass, dict[str, Any]], tuple[Type[DeclarativeBase], dict[str, Any]]]]
+    """ Builds the custom event model row for each event signature in event_model_mapping """
     event_model_overrides: dict[bytes, Type[DeclarativeBase]] | None = None
 
     def __init__(
@@ -284,58 +572,68 @@ class EventExporter(DBResourceExporter):
             default_model=event_model,
         )
 
-        self.event_model_mapping = ALL_EVENT_MODELS.copy()
-
         if event_model_overrides:
             self.event_model_overrides = event_model_overrides
-            self.event_model_mapping.update(event_model_overrides)
-
-    def write(self, resources: list[Dataclass]):
-        """Writes an event to the database."""
-        write_events = []
 
-        for event in resources:
-            encoded_dataclass = db_encode_dataclass(event)
-
-            if hasattr(event, "keys"):
-                event_signature = event.keys[0]
-            elif hasattr(event, "topics"):
-                event_signature = event.topics[0]
-            else:
-                event_signature = None
+        # Layers the overrides over the shared ALL_EVENT_MODELS instead of copying it for every exporter
+        self.event_model_mapping = ChainMap(dict(event_model_overrides or {}), ALL_EVENT_MODELS)
 
-            custom_model = self.event_model_mapping.get(event_signature) if event_signature else None
+        self.row_builders = {
+            event_signature: self._custom_row_builder(custom_model)
+            for event_signature, custom_model in self.event_model_mapping.items()
+        }
 
-            if custom_model:
-                model_fields = {
-                    k: v
-                    for k, v in encoded_dataclass.items()
-                    if k in ("block_number", "transaction_index", "event_index", "contract_address")
-                }
-
-                mapped_fields = {}
-                assert hasattr(
-                    event, "decoded_params"
-                ), "Event Dataclass must have decoded_params attribute to be exported to datastore"
+    def _custom_row_builder(
+        self, custom_model: Type[DeclarativeBase]
+    ) -> Callable[[Dataclass, dict[str, Any]], tuple[Type[DeclarativeBase], dict[str, Any]]]:
+        """
+        Returns a function building a custom event model row from an event dataclass & its encoded default model
+        params.  Rows are built as dicts instead of instantiating the ORM model, so the decoded params are checked
+        against the model's attributes directly.  If they can't be mapped onto the custom model, the row is
+        written to the default event model instead
+        """
+        model_attributes = frozenset(attr.key for attr in inspect(custom_model).column_attrs)
+
+        def _build(event: Dataclass, encoded_dataclass: dict[str, Any]) -> tuple[Type[DeclarativeBase], dict[str, Any]]:
+            assert hasattr(
+                event, "decoded_params"
+            ), "Event Dataclass must have decoded_params attribute to be exported to datastore"
+
+            row = {k: encoded_dataclass[k] for k in CUSTOM_EVENT_MODEL_FIELDS if k in encoded_dataclass}
+            decoded_params = event.decoded_params
+            if (
+                isinstance(decoded_params, dict)
+                and model_attributes.issuperset(decoded_params)
+                and row.keys().isdisjoint(decoded_params)
+            ):
+                row.update(decoded_params)
+                return custom_model, row
+
+            logger.warning(
+                f"Error encoding event to Custom Model {custom_model}.  "
+                f" Default Model Params: {row} -- Custom Model Params: {decoded_params}"
+            )
+            return self.default_model, encoded_dataclass
+
+        return _build
 
-                for event_param, event_val in event.decoded_params.items():
-                    # mapped_col: Column | None = custom_model.__table__.columns.get(event_param)
+    def write(self, resources: list[Dataclass]):
+        """Writes an event to the database."""
+        self._check_dataclass_fields(resources)
 
-                    mapped_fields.update({event_param: event_val})
+        rows_by_model: dict[Type[DeclarativeBase], list[dict[str, Any]]] = {self.default_model: []}
 
-                try:
-                    write_events.append(custom_model(**model_fields, **mapped_fields))
-                except (AttributeError, TypeError, IntegrityError):
-                    logger.warning(
-                        f"Error encoding event to Custom Model {custom_model}.  "
-                        f" Default Model Params: {model_fields} -- Custom Model Params: {mapped_fields}"
-                    )
-                    write_events.append(self.default_model(**encoded_dataclass))
+        for event, encoded_dataclass in zip(resources, db_encode_dataclasses(resources)):
+            signature = _event_signature(event)
+            row_builder = self.row_builders.get(signature) if signature is not None else None
 
+            if row_builder:
+                event_model, row = row_builder(event, encoded_dataclass)
+                rows_by_model.setdefault(event_model, []).append(row)
             else:
-                write_events.append(self.default_model(**encoded_dataclass))
+                rows_by_model[self.default_model].append(encoded_dataclass)
 
-        self._insert_models(write_events)
+        self._insert_rows({model: rows for model, rows in rows_by_model.items() if rows})
         self.resources_saved += len(resources)
 
 
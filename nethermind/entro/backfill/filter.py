@@ -266,9 +266,10 @@ def _generate_topics(
     if len(event_names) == 0:  # Backfill all events in ABI
         event_names = list(_named_events.keys())
 
-    selectors = ["0x" + _named_events[event].signature.hex() for event in event_names]
+    # Repeated event names would add duplicate selectors to the OR-ed topic filter of the eth_getLogs request
+    event_names = list(dict.fromkeys(event_names))
 
-    if len(selectors) != len(event_names):
+    if not set(event_names).issubset(_named_events.keys()):
         error_msg = (
             f"{decoder.loaded_abis[0]} ABI does not contain all of the events specified in the filter. "
             f"ABI Missing events: {set(event_names) - set(_named_events.keys())}"
@@ -276,6 +277,9 @@ def _generate_topics(
         logger.error(error_msg)
         raise BackfillError(error_msg)
 
+    # All selectors are queried as a single topic0 OR filter, so one eth_getLogs request covers every event
+    selectors = ["0x" + _named_events[event].signature.hex() for event in event_names]
+
     topics: list[str | list[str]] = []
     if len(selectors) == 1 and decoder.decoder_os == "EVM":
         # If only one event is being queried, pass event signatures as a string instead of array.
@@ -1,5 +1,3 @@
-from aiohttp import ClientSession, TCPConnector
-
 from nethermind.entro.exceptions import BackfillError
 from nethermind.entro.types.backfill import Dataclass, ExporterDataType
 from nethermind.idealis.rpc.ethereum import get_blocks, get_events_for_contract
@@ -13,14 +11,10 @@ def ethereum_block_importer(from_block: int, to_block: int, **kwargs) -> dict[Ex
     """Import ethereum blocks from a range of block numbers"""
 
     async def _get_rpc_block_data(**kwargs):
-        connector = TCPConnector(limit=kwargs.get("max_concurrency", 20))
-        client_session = ClientSession(connector=connector)
-        try:
-            blocks, _ = await get_blocks(
-                list(range(from_block, to_block)), kwargs["json_rpc"], client_session, full_transactions=False
-            )
-        finally:
-            await client_session.close()
+        client_session = kwargs["client_session"]
+        blocks, _ = await get_blocks(
+            list(range(from_block, to_block)), kwargs["json_rpc"], client_session, full_transactions=False
+        )
         return {ExporterDataType.blocks: blocks}
 
     if "json_rpc" in kwargs:
@@ -32,16 +26,12 @@ def ethereum_transaction_importer(from_block: int, to_block: int, **kwargs) -> d
     """Import ethereum transactions from a range of blocks"""
 
     async def _get_rpc_block_data(**kwargs):
-        connector = TCPConnector(limit=kwargs.get("max_concurrency", 20))
-        client_session = ClientSession(connector=connector)
-        try:
-            blocks, transactions = await get_blocks(
-                list(range(from_block, to_block)),
-                kwargs["json_rpc"],
-                client_session,
-            )
-        finally:
-            await client_session.close()
+        client_session = kwargs["client_session"]
+        blocks, transactions = await get_blocks(
+            list(range(from_block, to_block)),
+            kwargs["json_rpc"],
+            client_session,
+        )
         return {ExporterDataType.blocks: blocks, ExporterDataType.transactions: transactions}
 
     async def _get_account_txns(**kwargs):
@@ -69,21 +59,18 @@ def ethereum_event_importer(from_block: int, to_block: int, **kwargs) -> dict[Ex
     """Import ethereum events from a range of blocks"""
 
     async def _get_rpc_block_data(**kwargs):
-        client_session = ClientSession()
-        try:
-            events = await get_events_for_contract(
-                contract_address=to_bytes(kwargs["contract_address"], pad=20),
-                topics=[
-                    to_bytes(topic) if not isinstance(topic, list) else [to_bytes(t) for t in topic]
-                    for topic in kwargs["topics"]
-                ],
-                from_block=from_block,
-                to_block=to_block,
-                rpc_url=kwargs["json_rpc"],
-                aiohttp_session=client_session,
-            )
-        finally:
-            await client_session.close()
+        client_session = kwargs["client_session"]
+        events = await get_events_for_contract(
+            contract_address=to_bytes(kwargs["contract_address"], pad=20),
+            topics=[
+                to_bytes(topic) if not isinstance(topic, list) else [to_bytes(t) for t in topic]
+                for topic in kwargs["topics"]
+            ],
+            from_block=from_block,
+            to_block=to_block,
+            rpc_url=kwargs["json_rpc"],
+            aiohttp_session=client_session,
+        )
 
         return {ExporterDataType.events: events}
 
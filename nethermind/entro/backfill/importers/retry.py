@@ -1,27 +1,89 @@
 import asyncio
+import atexit
 import logging
 import time
 from typing import Any, Callable
 
+from aiohttp import ClientSession, TCPConnector
+
 from nethermind.entro.exceptions import BackfillError
 from nethermind.idealis.exceptions import RPCRateLimitError
 
+try:
+    from uvloop import new_event_loop  # type: ignore[import-not-found]
+except ImportError:
+    from asyncio import new_event_loop  # type: ignore[assignment]
+
 root_logger = logging.getLogger("nethermind")
 logger = root_logger.getChild("entro").getChild("importer")
 
+# Importers run on a single persistent event loop, so the client session (and its keep-alive connections) can be
+# reused across retries and across backfill batches instead of paying DNS & TLS setup on every asyncio.run().
+# If uvloop is installed, it is used for the importer loop
+_EVENT_LOOP: asyncio.AbstractEventLoop | None = None
+_CLIENT_SESSION: ClientSession | None = None
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    global _EVENT_LOOP  # pylint: disable=global-statement
+
+    if _EVENT_LOOP is not None and not _EVENT_LOOP.is_closed():
+        return _EVENT_LOOP
+
+    event_loop = _EVENT_LOOP = new_event_loop()
+    return event_loop
+
+
+async def _get_client_session(max_concurrency: int) -> ClientSession:
+    """
+    Returns the shared client session.  The session is recreated if the connection limit changes, which happens
+    when the concurrency is lowered after a rate limit error
+    """
+    global _CLIENT_SESSION  # pylint: disable=global-statement
+
+    if _CLIENT_SESSION is not None and not _CLIENT_SESSION.closed:
+        if _CLIENT_SESSION.connector is not None and _CLIENT_SESSION.connector.limit_per_host == max_concurrency:
+            return _CLIENT_SESSION
+        await _CLIENT_SESSION.close()
+
+    # Concurrency is capped per host, so requests to the RPC host queue for one of its warm keep-alive connections
+    # without limiting requests to other hosts
+    connector = TCPConnector(limit=0, limit_per_host=max_concurrency, keepalive_timeout=75, ttl_dns_cache=300)
+    _CLIENT_SESSION = ClientSession(connector=connector)
+    return _CLIENT_SESSION
+
+
+@atexit.register
+def close_client_session():
+    """Closes the shared client session and the importer event loop"""
+    global _CLIENT_SESSION  # pylint: disable=global-statement
+
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        return
+
+    if _CLIENT_SESSION is not None and not _CLIENT_SESSION.closed:
+        _EVENT_LOOP.run_until_complete(_CLIENT_SESSION.close())
+    _CLIENT_SESSION = None
+    _EVENT_LOOP.close()
+
 
 def retry_async_run(func: Callable[..., Any], **kwargs: Any) -> Any:
     """
-    Run an async function, retrying up to 5 times until it succeeds, backing off
+    Run an async function, retrying up to 5 times until it succeeds, backing off.  The function is passed the
+    shared aiohttp session as the client_session keyword argument
     """
 
     max_concurrency = kwargs.pop("max_concurrency", 10)
 
+    async def _run_with_session():
+        client_session = await _get_client_session(max_concurrency)
+        return await func(max_concurrency=max_concurrency, client_session=client_session, **kwargs)
+
     for retry_count in range(5):
         if retry_count > 0:
             logger.info(f"Executing {func.__name__}() -- Retry {retry_count}")
         try:
-            result = asyncio.run(func(max_concurrency=max_concurrency, **kwargs))
+            result = _get_event_loop().run_until_complete(_run_with_session())
             if retry_count > 0:
                 logger.info("Successful Retry... Continuing to next Data Batch")
             return result
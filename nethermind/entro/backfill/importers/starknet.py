@@ -1,7 +1,5 @@
 import asyncio
 
-from aiohttp import ClientSession, TCPConnector
-
 from nethermind.entro.exceptions import BackfillError
 from nethermind.entro.types.backfill import Dataclass, ExporterDataType
 from nethermind.idealis.parse.starknet.transaction import parse_transaction_responses
@@ -19,14 +17,10 @@ def starknet_transaction_importer(from_block: int, to_block: int, **kwargs) -> d
     """Import starknet transactions from a range of blocks"""
 
     async def _get_rpc_block_data(**kwargs):
-        connector = TCPConnector(limit=kwargs.get("max_concurrency", 20))
-        client_session = ClientSession(connector=connector)
-        try:
-            blocks, transactions, events = await get_blocks_with_txns(
-                list(range(from_block, to_block)), kwargs["json_rpc"], client_session
-            )
-        finally:
-            await client_session.close()
+        client_session = kwargs["client_session"]
+        blocks, transactions, events = await get_blocks_with_txns(
+            list(range(from_block, to_block)), kwargs["json_rpc"], client_session
+        )
         return {
             ExporterDataType.blocks: blocks,
             ExporterDataType.transactions: parse_transaction_responses(transactions),
@@ -55,27 +49,23 @@ def starknet_event_importer(from_block: int, to_block: int, **kwargs) -> dict[Ex
     """Import starknet events from a range of block numbers"""
 
     async def _get_starknet_events_for_range(**kwargs):
-        connector = TCPConnector(limit=kwargs.get("max_concurrency", 20))
-        client_session = ClientSession(connector=connector)
-        try:
-            event_batches = await asyncio.gather(
-                *[
-                    get_events_for_contract(
-                        contract_address=kwargs["contract_address"],
-                        event_keys=[to_bytes(t) for t in kwargs["topics"][0]],
-                        from_block=from_,
-                        to_block=to_,
-                        rpc_url=kwargs["json_rpc"],
-                        aiohttp_session=client_session,
-                    )
-                    for from_, to_ in _split_range(from_block, to_block)
-                ]
-            )
-            output_events = []
-            for batch in event_batches:
-                output_events.extend(batch)
-        finally:
-            await client_session.close()
+        client_session = kwargs["client_session"]
+        event_batches = await asyncio.gather(
+            *[
+                get_events_for_contract(
+                    contract_address=kwargs["contract_address"],
+                    event_keys=[to_bytes(t) for t in kwargs["topics"][0]],
+                    from_block=from_,
+                    to_block=to_,
+                    rpc_url=kwargs["json_rpc"],
+                    aiohttp_session=client_session,
+                )
+                for from_, to_ in _split_range(from_block, to_block)
+            ]
+        )
+        output_events = []
+        for batch in event_batches:
+            output_events.extend(batch)
         return output_events
 
     if "json_rpc" in kwargs and "contract_address" in kwargs and "topics" in kwargs:
@@ -88,12 +78,8 @@ def starknet_block_importer(from_block: int, to_block: int, **kwargs) -> dict[Ex
     """Import starknet blocks from a range of block numbers"""
 
     async def _get_starknet_blocks_for_range(**kwargs):
-        connector = TCPConnector(limit=kwargs.get("max_concurrency", 20))
-        client_session = ClientSession(connector=connector)
-        try:
-            blocks = await get_blocks(list(range(from_block, to_block)), kwargs["json_rpc"], client_session)
-        finally:
-            await client_session.close()
+        client_session = kwargs["client_session"]
+        blocks = await get_blocks(list(range(from_block, to_block)), kwargs["json_rpc"], client_session)
 
         return {ExporterDataType.blocks: blocks}
 
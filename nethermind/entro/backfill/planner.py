@@ -1,12 +1,12 @@
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from typing import Any, Type, Union
 
 from rich.console import Console
 from rich.progress import Progress
 from rich.table import Table
-from sqlalchemy import create_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from nethermind.entro.backfill.exporters import (
@@ -16,6 +16,7 @@ from nethermind.entro.backfill.exporters import (
     get_file_exporters_for_backfill,
 )
 from nethermind.entro.backfill.importers import get_importer_for_backfill
+from nethermind.entro.database.engine import create_db_engine
 from nethermind.entro.database.readers.internal import fetch_backfills_by_datatype
 from nethermind.entro.database.writers.utils import automap_sqlalchemy_model
 from nethermind.entro.decoding import DecodingDispatcher
@@ -105,7 +106,7 @@ class BackfillPlan:
             return None
 
         filter_params, metadata_dict = _unpack_kwargs(kwargs, backfill_type)
-        db_session = sessionmaker(create_engine(kwargs["db_url"]))() if kwargs["db_url"] else None
+        db_session = sessionmaker(create_db_engine(kwargs["db_url"]))() if kwargs["db_url"] else None
 
         decoder = cls._initialize_decoder(db_session, metadata_dict, network)
 
@@ -261,7 +262,13 @@ class BackfillPlan:
         :param display_progress: Whether to display progress bar during backfill.  If None, uses self.no_interaction
         """
 
-        with Progress(*progress_defaults, console=console, disable=display_progress or self.no_interaction) as progress:
+        # Worker threads are only started once a batch is written concurrently
+        export_pool = ThreadPoolExecutor(max_workers=max(len(self.exporters), 1), thread_name_prefix="entro-export")
+
+        with (
+            export_pool,
+            Progress(*progress_defaults, console=console, disable=display_progress or self.no_interaction) as progress,
+        ):
             for range_idx, (range_start, range_end) in enumerate(self.range_plan.backfill_ranges):
                 range_progress = progress.add_task(
                     description=self.backfill_label(range_idx),
@@ -295,13 +302,16 @@ class BackfillPlan:
                         self.process_failed_backfill(batch_start)
                         return
 
+                    export_batches = []
                     for data_kind, exporter in self.exporters.items():
                         export_dataclasses = batch_dataclasses.get(data_kind, [])
 
                         if self.decoder:
                             self.decoder.decode_dataclasses(data_kind, export_dataclasses)
 
-                        exporter.write(export_dataclasses)
+                        export_batches.append((exporter, export_dataclasses))
+
+                    self._export_batch(export_pool, export_batches)
 
                     progress.update(range_progress, advance=batch_end - batch_start, searching_block=batch_end)
 
@@ -309,6 +319,28 @@ class BackfillPlan:
 
         logger.info("---- Backfill Complete ------")
 
+    @staticmethod
+    def _export_batch(
+        export_pool: ThreadPoolExecutor, export_batches: list[tuple[AbstractResourceExporter, list[Dataclass]]]
+    ):
+        """
+        Writes a batch of dataclasses to each exporter.  If every exporter supports concurrent writes, the exporters
+        write in parallel, overlapping the database round-trips of the separate tables.  Returns once every exporter
+        has finished, so each exporter is only written to by one thread at a time.
+
+        :param export_pool: Thread pool for concurrent writes
+        :param export_batches: (exporter, dataclasses) pairs to write
+        """
+        if len(export_batches) < 2 or not all(exporter.concurrent_writes for exporter, _ in export_batches):
+            for exporter, export_dataclasses in export_batches:
+                exporter.write(export_dataclasses)
+            return
+
+        futures = [export_pool.submit(exporter.write, dataclasses) for exporter, dataclasses in export_batches]
+        wait(futures)
+        for future in futures:
+            future.result()  # Re-raise the first exporter error
+
     def print_backfill_plan(self, console: Console):  # pylint: disable=too-many-locals
         """Prints the backfill plan to the console"""
 
@@ -1,12 +1,12 @@
 import asyncio
 import os
+from array import array
 from bisect import bisect_right
 from datetime import date, datetime, timezone
-from typing import Sequence
+from typing import Iterable, Sequence
 
 from aiohttp import ClientSession
 from rich.progress import Progress
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from nethermind.entro.backfill.utils import (
@@ -14,6 +14,7 @@ from nethermind.entro.backfill.utils import (
     default_rpc,
     get_current_block_number,
 )
+from nethermind.entro.database.engine import create_db_engine
 from nethermind.entro.database.readers.internal import (
     first_block_timestamp,
     get_block_timestamps,
@@ -71,15 +72,21 @@ class TimestampConverter:
     Class to convert between block numbers and datetimes.
     """
 
-    timestamp_data: list[BlockTimestamp] = []
+    _block_numbers: array
     """
-        List of BlockTimestamps.  This is the source of truth for block to datetime conversions.
-        
+        Block numbers of the cached timestamps, stored as a contiguous int64 array.  Together with _timestamps, this
+        is the source of truth for block to datetime conversions.
+
         If db_session is not None, this will be populated from the DB.  Otherwise, it will be populated from a
         cached json file in the CWD.
-        
-        BlockTimestamps are ordered by block number, and the block number is guaranteed to be a multiple of
-        timestamp_resolution.  When performing conversions, array bisection is used to find the closest blocks
+
+        Block numbers are ordered, and each block number is guaranteed to be a multiple of timestamp_resolution.
+    """
+
+    _timestamps: array
+    """
+        Unix timestamps (in seconds) of the blocks in _block_numbers, stored as a contiguous int64 array.  When
+        performing conversions, this array is bisected to find the closest blocks
     """
 
     last_update_block: int
@@ -122,17 +129,33 @@ class TimestampConverter:
         else:
             self.json_rpc = default_rpc(network)
 
-        self.db_session = sessionmaker(create_engine(db_url))() if db_url else None
+        self.db_session = sessionmaker(create_db_engine(db_url))() if db_url else None
 
-        self.timestamp_data = get_block_timestamps(
-            db_session=self.db_session,
-            network=network,
-            resolution=self.timestamp_resolution,
+        self._set_timestamps(
+            get_block_timestamps(
+                db_session=self.db_session,
+                network=network,
+                resolution=self.timestamp_resolution,
+            )
         )
 
         if auto_update:
             self.update_timestamps()
 
+    @property
+    def timestamp_data(self) -> list[BlockTimestamp]:
+        """List of BlockTimestamps ordered by block number"""
+        return [
+            BlockTimestamp(block_number=block_number, timestamp=datetime.fromtimestamp(timestamp, tz=timezone.utc))
+            for block_number, timestamp in zip(self._block_numbers, self._timestamps)
+        ]
+
+    def _set_timestamps(self, timestamps: Iterable[BlockTimestamp]):
+        """Sorts BlockTimestamps by block number, and stores them as block number & unix timestamp arrays"""
+        sorted_timestamps = sorted(timestamps, key=lambda x: x.block_number)
+        self._block_numbers = array("q", [ts.block_number for ts in sorted_timestamps])
+        self._timestamps = array("q", [int(ts.timestamp.timestamp()) for ts in sorted_timestamps])
+
     def update_timestamps(self, progress_bar: Progress | None = None):
         """
         Updates the timestamp_data list with the latest block timestamps.  If db_session is not None, this will
@@ -142,7 +165,7 @@ class TimestampConverter:
         """
         current_block = get_current_block_number(self.network)
         block_ranges = set(range(0, current_block, self.timestamp_resolution))
-        existing_blocks = {ts.block_number for ts in self.timestamp_data}
+        existing_blocks = set(self._block_numbers)
         blocks_to_query = list(block_ranges - existing_blocks)
 
         if not blocks_to_query:
@@ -150,8 +173,7 @@ class TimestampConverter:
 
         new_timestamps = self.get_timestamps_from_rpc(blocks_to_query, progress_bar)
 
-        self.timestamp_data.extend(new_timestamps)
-        self.timestamp_data.sort(key=lambda x: x.block_number)
+        self._set_timestamps(self.timestamp_data + new_timestamps)
         self.last_update_block = current_block
 
     def get_timestamps_from_rpc(self, blocks: list[int], progress_bar: Progress | None = None) -> list[BlockTimestamp]:
@@ -225,15 +247,15 @@ class TimestampConverter:
         floor_num = block_number // self.timestamp_resolution
 
         if block_number % self.timestamp_resolution == 0:
-            return self.timestamp_data[floor_num].timestamp
+            return datetime.fromtimestamp(self._timestamps[floor_num], tz=timezone.utc)
 
-        lower, upper = (
-            self.timestamp_data[floor_num],
-            self.timestamp_data[floor_num + 1],
-        )
-        block_time = (upper.timestamp - lower.timestamp) / self.timestamp_resolution
+        lower_block, lower_timestamp = self._block_numbers[floor_num], self._timestamps[floor_num]
+        block_time = (self._timestamps[floor_num + 1] - lower_timestamp) / self.timestamp_resolution
 
-        return lower.timestamp + ((block_number - lower.block_number) * block_time)
+        return datetime.fromtimestamp(
+            lower_timestamp + ((block_number - lower_block) * block_time),
+            tz=timezone.utc,
+        )
 
     def datetime_to_block(self, dt: datetime | date) -> int:
         """
@@ -253,16 +275,15 @@ class TimestampConverter:
         # pylint: enable=unidiomatic-typecheck
 
         elif dt.tzinfo is None:  # type: ignore[union-attr]
-            dt.replace(tzinfo=timezone.utc)  # type: ignore[call-arg]
-
-        timestamp_index = bisect_right(self.timestamp_data, dt, key=lambda x: x.timestamp)
+            dt = dt.replace(tzinfo=timezone.utc)  # type: ignore[call-arg]
 
-        lower = self.timestamp_data[timestamp_index - 1]
-        upper = self.timestamp_data[timestamp_index]
+        timestamp = dt.timestamp()  # type: ignore[union-attr]
+        timestamp_index = bisect_right(self._timestamps, timestamp)
 
-        block_time = (upper.timestamp - lower.timestamp) / self.timestamp_resolution
+        lower_timestamp = self._timestamps[timestamp_index - 1]
+        block_time = (self._timestamps[timestamp_index] - lower_timestamp) / self.timestamp_resolution
 
-        return lower.block_number + int((dt - lower.timestamp) / block_time)
+        return self._block_numbers[timestamp_index - 1] + int((timestamp - lower_timestamp) / block_time)
 
     def process_range(
         self,
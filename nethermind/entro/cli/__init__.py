@@ -21,11 +21,10 @@ def cli_migrate_up(db_url):
     """
     Migrate DB Tables to Latest Version
     """
-    from sqlalchemy import create_engine
-
+    from nethermind.entro.database.engine import create_db_engine
     from nethermind.entro.database.migrations import migrate_up
 
-    db_engine = create_engine(db_url)
+    db_engine = create_db_engine(db_url)
     click.echo("Starting Database Migrations")
 
     migrate_up(db_engine)
@@ -112,6 +112,7 @@ def transactions(
     event_name_option,
     source_option,
     batch_size_option,
+    max_concurrency_option,
 )
 def events(
     **kwargs,
@@ -186,6 +187,7 @@ def events(
     from_block_option,
     to_block_option,
     batch_size_option,
+    max_concurrency_option,
     block_file_option,
 )
 def blocks(
@@ -232,6 +234,7 @@ def blocks(
     from_block_option,
     to_block_option,
     batch_size_option,
+    max_concurrency_option,
 )
 def full_blocks(
     **kwargs,
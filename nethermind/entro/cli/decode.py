@@ -1,5 +1,5 @@
 import logging
-from typing import Literal
+from typing import Any, Literal
 
 import click
 
@@ -25,56 +25,94 @@ def decode_group():
 # TODO: Fix DRY betweem add-abi & add-class
 
 
-@decode_group.command()
-@group_options(db_url_option)
-@click.argument("abi_name")
-@click.argument("abi_json", type=click.File("r"))
-@click.option("--priority", type=int, default=0)
-def add_abi(db_url: str | None, abi_name: str, abi_json, priority: int):
-    """Adds an ABI to the database"""
+def _add_evm_abis(db_url: str | None, abis: list[tuple[str, Any, int]]):
+    """
+    Checks a list of EVM ABIs for conflicts with the ABIs already in the database, then writes them in a single
+    transaction.  If any ABI fails to load into the dispatcher, nothing is written.
+
+    :param db_url: Database URL.  If None, ABIs are cached to a file in the app directory
+    :param abis: (ABI name, ABI JSON file, priority) for each ABI to add
+    """
 
-    import json
     from nethermind.entro.cli.utils import cli_logger_config, create_cli_session
     from nethermind.entro.database.readers.internal import get_abis
-    from nethermind.entro.database.writers.internal import write_abi
+    from nethermind.entro.database.writers.internal import write_abis
     from nethermind.entro.database.models.internal import ContractABI
     from nethermind.entro.exceptions import DecodingError
     from nethermind.entro.decoding import DecodingDispatcher
+    from nethermind.entro.utils import json_loads
 
     console = cli_logger_config(root_logger)
     root_logger.setLevel(logging.WARNING)
 
     db_session = create_cli_session(db_url) if db_url else None
-    loaded_abis = get_abis(db_session)
-
-    console.print(
-        f"Attempting to add ABI {abi_name} to Decoder with priority {priority}.  Checking for "
-        f"conflicts with {len(loaded_abis)} existing ABIs"
-    )
-
-    add_abi_dict = json.loads(abi_json.read())
+    try:
+        loaded_abis = get_abis(db_session)
+
+        if len(abis) == 1:
+            console.print(
+                f"Attempting to add ABI {abis[0][0]} to Decoder with priority {abis[0][2]}.  Checking for "
+                f"conflicts with {len(loaded_abis)} existing ABIs"
+            )
+        else:
+            console.print(
+                f"Attempting to add {len(abis)} ABIs to Decoder.  Checking for conflicts with {len(loaded_abis)} "
+                f"existing ABIs"
+            )
+
+        dispatcher = DecodingDispatcher()
+
+        # These ABIs have already been verified and added to DB
+        for existing_abi in loaded_abis:
+            dispatcher.add_abi(
+                existing_abi.abi_name,
+                json_loads(existing_abi.abi_json) if isinstance(existing_abi.abi_json, str) else existing_abi.abi_json,
+                existing_abi.priority,
+            )
+
+        new_abis = []
+        for abi_name, abi_json, priority in abis:
+            add_abi_dict = json_loads(abi_json.read())
+            try:
+                dispatcher.add_abi(abi_name, add_abi_dict, priority)
+            except DecodingError as e:
+                logger.error(e)
+                return
+
+            new_abis.append(ContractABI(abi_name=abi_name, abi_json=add_abi_dict, priority=priority, decoder_os="EVM"))
+
+        write_abis(new_abis, db_session)
+    finally:
+        if db_session:
+            db_session.close()
+
+    for new_abi in new_abis:
+        console.print(f"[green]Successfully Added {new_abi.abi_name} to Database with Priority {new_abi.priority}")
 
-    dispatcher = DecodingDispatcher()
 
-    # These ABIs have already been verified and added to DB
-    for existing_abi in loaded_abis:
-        dispatcher.add_abi(
-            existing_abi.abi_name,
-            json.loads(existing_abi.abi_json) if isinstance(existing_abi.abi_json, str) else existing_abi.abi_json,
-            existing_abi.priority,
-        )
-
-    try:
-        dispatcher.add_abi(abi_name, add_abi_dict, priority)
-    except DecodingError as e:
-        logger.error(e)
-        return
+@decode_group.command()
+@group_options(db_url_option)
+@click.argument("abi_name")
+@click.argument("abi_json", type=click.File("rb"))
+@click.option("--priority", type=int, default=0)
+def add_abi(db_url: str | None, abi_name: str, abi_json, priority: int):
+    """Adds an ABI to the database"""
+    _add_evm_abis(db_url, [(abi_name, abi_json, priority)])
 
-    write_abi(ContractABI(abi_name=abi_name, abi_json=add_abi_dict, priority=priority, decoder_os="EVM"), db_session)
-    if db_session:
-        db_session.close()
 
-    console.print(f"[green]Successfully Added {abi_name} to Database with Priority {priority}")
+@decode_group.command()
+@group_options(db_url_option)
+@click.option(
+    "--abi",
+    "abis",
+    type=(str, click.File("rb"), int),
+    multiple=True,
+    required=True,
+    help="ABI name, ABI JSON file, and priority.  Can be input multiple times to add several ABIs at once",
+)
+def add_abis(db_url: str | None, abis):
+    """Adds multiple ABIs to the database in a single transaction"""
+    _add_evm_abis(db_url, list(abis))
 
 
 @decode_group.command()
@@ -100,19 +100,16 @@ def get_starknet_contract_implementation(contract_address: str, json_rpc: str |
     current_block = sync_get_current_block(json_rpc)
 
     async def _get_contract_impl(contract: bytes) -> ContractImplementation | None:
-        session = ClientSession()
         class_decoder = PessimisticDecoder(json_rpc)
 
-        impl = await generate_contract_implementation(
-            class_decoder=class_decoder,
-            rpc_url=json_rpc,
-            aiohttp_session=session,
-            contract_address=contract,
-            to_block=current_block,
-        )
-
-        await session.close()
-        return impl
+        async with ClientSession() as session:
+            return await generate_contract_implementation(
+                class_decoder=class_decoder,
+                rpc_url=json_rpc,
+                aiohttp_session=session,
+                contract_address=contract,
+                to_block=current_block,
+            )
 
     contract_bytes = to_bytes(contract_address, pad=32)
     impl = asyncio.run(_get_contract_impl(contract_bytes))
@@ -147,6 +144,8 @@ def get_decoded_transaction(transaction_hash, json_rpc, full_trace, raw):
     from rich.console import Console
     from rich.panel import Panel
 
+    from nethermind.entro.decoding.utils import felts_to_ints
+    from nethermind.idealis.exceptions import RPCError
     from nethermind.idealis.parse.shared.trace import group_traces
     from nethermind.idealis.parse.starknet.trace import replace_delegate_calls_for_tx
     from nethermind.idealis.rpc.starknet.trace import trace_transaction
@@ -158,26 +157,30 @@ def get_decoded_transaction(transaction_hash, json_rpc, full_trace, raw):
     cli_logger_config(root_logger)
 
     async def _get_tx_trace() -> tuple[list[Trace], list[Event]]:
-        session = ClientSession()
-        tx_trace = await trace_transaction(
-            transaction_hash=to_bytes(transaction_hash),
-            rpc_url=json_rpc,
-            aiohttp_session=session,
-        )
+        async with ClientSession() as session:
+            tx_trace = await trace_transaction(
+                transaction_hash=to_bytes(transaction_hash),
+                rpc_url=json_rpc,
+                aiohttp_session=session,
+            )
 
         call_trace = replace_delegate_calls_for_tx(tx_trace.execute_traces)
-        await session.close()
         return call_trace, tx_trace.execute_events
 
     class_decoder = PessimisticDecoder(json_rpc)
 
-    call_traces, events = asyncio.run(_get_tx_trace())
+    try:
+        call_traces, events = asyncio.run(_get_tx_trace())
+    except RPCError as e:
+        raise click.BadParameter(
+            f"Could not trace transaction {transaction_hash}:  {e}", param_hint="'TRANSACTION_HASH'"
+        ) from e
 
     for trace in call_traces:
         try:
             decoded = class_decoder.decode_function(
-                calldata=[int.from_bytes(c, "big") for c in trace.calldata],
-                result=[int.from_bytes(r, "big") for r in trace.result],
+                calldata=felts_to_ints(trace.calldata),
+                result=felts_to_ints(trace.result),
                 function_selector=trace.selector,
                 class_hash=trace.class_hash,
             )
@@ -197,8 +200,8 @@ def get_decoded_transaction(transaction_hash, json_rpc, full_trace, raw):
 
     for event in events:
         decoded_event = class_decoder.decode_event(
-            keys=[int.from_bytes(k, "big") for k in event.keys],
-            data=[int.from_bytes(d, "big") for d in event.data],
+            keys=felts_to_ints(event.keys),
+            data=felts_to_ints(event.data),
             class_hash=event.class_hash,
         )
 
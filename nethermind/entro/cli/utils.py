@@ -260,12 +260,13 @@ resolution_option = click.option(  # Timestamp Resolution for TimestampConverter
 def create_cli_session(db_url: str) -> Session:
     """Creates a new database session"""
 
-    from sqlalchemy import create_engine
     from sqlalchemy.orm import sessionmaker
 
+    from nethermind.entro.database.engine import create_db_engine
+
     if db_url is None:
         logger.error("Database URL not specified... Set with '--db-url' option or 'DB_URL' environment variable")
         raise SystemExit(1)
 
-    engine = create_engine(db_url)
+    engine = create_db_engine(db_url)
     return sessionmaker(bind=engine)()
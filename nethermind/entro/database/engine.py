@@ -0,0 +1,28 @@
+from typing import Any
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.engine import make_url
+
+# psycopg2 runs executemany() as one statement per parameter set.  These options fold INSERTs into multi-row
+# VALUES statements, and page UPDATE/DELETE batches through psycopg2.extras.execute_batch
+PSYCOPG2_ENGINE_KWARGS: dict[str, Any] = {
+    "executemany_mode": "values_plus_batch",
+    "insertmanyvalues_page_size": 1000,
+    "executemany_batch_page_size": 500,
+}
+
+
+def create_db_engine(db_url: str, **kwargs: Any) -> Engine:
+    """
+    Creates a SQLAlchemy engine for the database URL.  If the URL uses the psycopg2 driver, enables the psycopg2
+    fast execution helpers for executemany() calls
+
+    :param db_url: Database URL
+    :param kwargs: Additional keyword arguments passed to create_engine
+    :return: SQLAlchemy Engine
+    """
+    url = make_url(db_url)
+    if url.get_dialect().driver == "psycopg2":
+        kwargs = {**PSYCOPG2_ENGINE_KWARGS, **kwargs}
+
+    return create_engine(url, **kwargs)
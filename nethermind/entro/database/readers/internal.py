@@ -12,6 +12,7 @@ from nethermind.entro.database.models.base import AbstractBlock
 from nethermind.entro.database.models.internal import BackfilledRange, ContractABI
 from nethermind.entro.types.backfill import BackfillDataType as BDT
 from nethermind.entro.types.backfill import BlockTimestamp, SupportedNetwork
+from nethermind.entro.utils import json_loads
 
 from .utils import execute_scalars_query
 
@@ -152,19 +153,16 @@ def get_block_timestamps(
     if not os.path.exists(file_path := os.path.join(app_dir, f"{network.name}-timestamps.json")):
         return []
 
-    with open(file_path, "rt") as timestamp_file:
-        if os.path.getsize(file_path) != 0:
-            timestamp_json: list[dict[str, Any]] = json.load(timestamp_file)
-        else:
-            timestamp_json = []
-
-        timestamps = [
-            BlockTimestamp(
-                block_number=t["block_number"],
-                timestamp=datetime.datetime.fromisoformat(t["timestamp"]),
-            )
-            for t in timestamp_json
-        ]
+    with open(file_path, "rb") as timestamp_file:
+        timestamp_json: list[dict[str, Any]] = json_loads(timestamp_file.read()) if os.path.getsize(file_path) else []
 
-        filtered_timestamps = [t for t in timestamps if t.block_number % resolution == 0]
-        return sorted(filtered_timestamps, key=lambda t: t.block_number)
+    # Filter on the raw entries, so timestamps are only parsed for blocks at the requested resolution
+    timestamps = [
+        BlockTimestamp(
+            block_number=t["block_number"],
+            timestamp=datetime.datetime.fromisoformat(t["timestamp"]),
+        )
+        for t in timestamp_json
+        if t["block_number"] % resolution == 0
+    ]
+    return sorted(timestamps, key=lambda t: t.block_number)
@@ -1,11 +1,10 @@
-import datetime
 import json
 import logging
 import os
-from dataclasses import asdict
 from typing import Any, Literal
 
 import click.utils
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from nethermind.entro.database.models.internal import ContractABI
@@ -21,9 +20,18 @@ def write_abi(abi: ContractABI, db_session: Session | None):
     Writes a ContractABI model to the datastore.  If a db_session is supplied, writes to the DB, otherwise,
     caches to a file in the default app directory for the given OS
     """
+    write_abis([abi], db_session)
+
+
+def write_abis(abis: list[ContractABI], db_session: Session | None):
+    """
+    Writes multiple ContractABI models to the datastore in a single transaction.  If a db_session is supplied,
+    writes to the DB, otherwise, caches to a file in the default app directory for the given OS
+    """
 
     if db_session:
-        db_session.add(abi)
+        # Core executemany keeps the models transient, so reading them after commit doesn't refresh each row
+        db_session.execute(insert(ContractABI), [model_to_dict(abi) for abi in abis])
         db_session.commit()
     else:
         if not os.path.exists(app_dir := click.utils.get_app_dir("entro")):
@@ -40,7 +48,7 @@ def write_abi(abi: ContractABI, db_session: Session | None):
 
         # TODO: Clean this up & Add better error handling.  A ^C in this block could corrupt stored ABIs...
 
-        abi_json.append(model_to_dict(abi))
+        abi_json.extend(model_to_dict(abi) for abi in abis)
 
         with open(contract_path, "wt") as abi_file:
             json.dump(abi_json, abi_file)
@@ -108,17 +116,13 @@ def write_block_timestamps(
     else:
         timestamp_json = []
 
-    existing_timestamps = [
-        BlockTimestamp(block_number=t["block_number"], timestamp=datetime.datetime.fromisoformat(t["timestamp"]))
-        for t in timestamp_json
-    ]
-
-    existing_blocks = {t.block_number for t in existing_timestamps}
-    existing_timestamps.extend([t for t in timestamps if t.block_number not in existing_blocks])
-
-    dataclass_dicts = [asdict(t) for t in existing_timestamps]
-    for t in dataclass_dicts:
-        t["timestamp"] = t["timestamp"].isoformat()
+    # Existing entries are already serialized, so only the new timestamps are converted
+    existing_blocks = {t["block_number"] for t in timestamp_json}
+    timestamp_json.extend(
+        {"block_number": t.block_number, "timestamp": t.timestamp.isoformat()}
+        for t in timestamps
+        if t.block_number not in existing_blocks
+    )
 
     with open(file_path, "wt") as timestamp_file:
-        json.dump(dataclass_dicts, timestamp_file)
+        json.dump(timestamp_json, timestamp_file)
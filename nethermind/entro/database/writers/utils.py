@@ -1,11 +1,14 @@
+import functools
 import logging
-from typing import Any, Type
+from typing import Any, Callable, Literal, Sequence, Type, cast
 
 from hexbytes import HexBytes
-from sqlalchemy import Connection, Engine, MetaData, inspect
+from sqlalchemy import Column, Connection, Engine, MetaData, Table, insert, inspect
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.automap import automap_base
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.sql.schema import ScalarElementColumnDefault
 
 from nethermind.entro.exceptions import DatabaseError
 
@@ -18,10 +21,92 @@ def model_to_dict(model) -> dict[str, Any]:
     return {c.key: getattr(model, c.key) for c in inspect(model).mapper.column_attrs}
 
 
+def bulk_insert(
+    session: Session,
+    model: Type[DeclarativeBase],
+    rows: Sequence[dict[str, Any]],
+    on_conflict: Literal["ignore", "overwrite", "fail"] = "fail",
+):
+    """
+    Writes rows to a model's table with a single executemany INSERT statement, which SQLAlchemy sends
+    as batched multi-row VALUES.  On postgres & sqlite, conflicting primary keys are handled with ON CONFLICT.
+
+    * ignore -- ON CONFLICT DO NOTHING
+    * overwrite -- ON CONFLICT (primary key) DO UPDATE, setting every non primary key column
+    * fail -- Plain INSERT, conflicting primary keys raise an IntegrityError
+
+    Other dialects do not support ON CONFLICT, and always use a plain INSERT.
+
+    Runs inside the session's current transaction, so the caller is responsible for committing.
+
+    :param session: Database session
+    :param model: ORM model class of the rows being written
+    :param rows: Rows to write, keyed by model attribute name.  Missing attributes are written as None
+    :param on_conflict: Handling of rows with conflicting primary keys
+    """
+    columns = _model_columns(model)
+
+    params = []
+    for row in rows:
+        row_params = {}
+        for key, column in columns:
+            value = row.get(key)
+            if value is None and isinstance(column.default, ScalarElementColumnDefault):
+                value = column.default.arg  # Match the ORM, which fills scalar defaults for unset attributes
+            row_params[column.name] = value
+        params.append(row_params)
+
+    session.execute(_insert_statement(model, session.get_bind().dialect.name, on_conflict), params)
+
+
+@functools.cache
+def _model_columns(model: Type[DeclarativeBase]) -> tuple[tuple[str, Column], ...]:
+    """Returns the (attribute name, column) pairs of a model"""
+    return tuple((attr.key, cast(Column, attr.columns[0])) for attr in inspect(model).column_attrs)
+
+
+@functools.cache
+def _insert_statement(model: Type[DeclarativeBase], dialect_name: str, on_conflict: str):
+    """
+    Builds the INSERT statement used by bulk_insert.  Exporters write every batch with the same model, dialect and
+    conflict handling, so statements are built once & reused.
+    """
+    table = cast(Table, model.__table__)
+
+    dialect_insert: Callable[[Table], postgresql.Insert | sqlite.Insert] | None
+    match dialect_name:
+        case "postgresql":
+            dialect_insert = postgresql.insert
+        case "sqlite":
+            dialect_insert = sqlite.insert
+        case _:
+            dialect_insert = None
+
+    if dialect_insert is None or on_conflict == "fail":
+        return insert(table)
+
+    statement = dialect_insert(table)
+    update_columns = {
+        column.name: statement.excluded[column.name] for _, column in _model_columns(model) if not column.primary_key
+    }
+
+    if on_conflict == "overwrite" and update_columns:
+        return statement.on_conflict_do_update(
+            index_elements=[column.name for column in table.primary_key.columns], set_=update_columns
+        )
+
+    return statement.on_conflict_do_nothing()
+
+
 def db_encode_hex(data: str | HexBytes | bytes, db_dialect: str) -> str | bytes:
     """
     Encodes data to a hex string or bytes depending on the database dialect
 
+    >>> db_encode_hex("0xabc", "postgresql")
+    b'\\n\\xbc'
+    >>> db_encode_hex("0a0b", "postgresql")
+    b'\\n\\x0b'
+
     :param data: Hex data to encode
     :param db_dialect: current database dialect
     :return:
@@ -29,7 +114,9 @@ def db_encode_hex(data: str | HexBytes | bytes, db_dialect: str) -> str | bytes:
     match db_dialect:
         case "postgresql":
             if isinstance(data, str):
-                return bytes.fromhex(data[2:])
+                # bytes.fromhex parses in C, so only strip the prefix and left-pad odd-length strings in python
+                hex_str = data[2:] if data[:2] in ("0x", "0X") else data
+                return bytes.fromhex(hex_str if len(hex_str) % 2 == 0 else "0" + hex_str)
             if isinstance(data, bytes | HexBytes):
                 return data
             raise ValueError(f"Invalid data type: {type(data)}")
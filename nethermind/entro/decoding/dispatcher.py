@@ -1,4 +1,3 @@
-import json
 import logging
 import shutil
 from typing import Any, Literal, Sequence, TypedDict
@@ -14,7 +13,7 @@ from nethermind.entro.types.backfill import (
     ExporterDataType,
     SupportedNetwork,
 )
-from nethermind.entro.utils import pprint_list
+from nethermind.entro.utils import json_loads, pprint_list
 from nethermind.starknet_abi import StarknetAbi
 
 from ..database.readers.internal import get_abis
@@ -267,7 +266,7 @@ class DecodingDispatcher:
             dispatcher.add_abi(
                 abi_name=abi.abi_name,
                 abi_data=(
-                    json.loads(abi.abi_json) if isinstance(abi.abi_json, (str, bytes)) else abi.abi_json  # type: ignore
+                    json_loads(abi.abi_json) if isinstance(abi.abi_json, (str, bytes)) else abi.abi_json  # type: ignore
                 ),
                 priority=abi.priority,
             )
@@ -12,14 +12,14 @@ from web3._utils.abi import (
 )
 from web3._utils.events import get_event_abi_types_for_decoding
 
-from nethermind.entro.decoding.utils import decode_evm_abi_from_types
+from nethermind.entro.decoding.utils import decode_evm_abi_from_types, felts_to_ints
 from nethermind.entro.exceptions import DecodingError
 from nethermind.entro.types.decoding import DecodedEvent
 from nethermind.starknet_abi import AbiEvent
 from nethermind.starknet_abi.abi_types import StarknetType
 from nethermind.starknet_abi.exceptions import InvalidCalldataError, TypeDecodeError
 
-from .utils import abi_to_signature
+from .utils import abi_to_signature, format_values
 
 root_logger = logging.getLogger("nethermind")
 logger = root_logger.getChild("entro").getChild("decoding")
@@ -52,8 +52,8 @@ class CairoEventDecoder(AbiEvent):
         """Decode Starknet Event from binary calldata"""
         try:
             return super().decode(
-                data=[int.from_bytes(d, "big") for d in data],
-                keys=[int.from_bytes(k, "big") for k in keys],
+                data=felts_to_ints(data),
+                keys=felts_to_ints(keys),
             )
 
         except (InvalidCalldataError, TypeDecodeError):
@@ -88,6 +88,8 @@ class EVMEventDecoder:
     _topic_names: list[str]
 
     formatters: dict[str, Callable[[Any], Any]] = {}
+    _data_formatters: list[Callable[[Any], Any] | None]
+    _topic_formatters: list[Callable[[Any], Any] | None]
 
     def __init__(self, abi_event: ABIEvent, abi_name: str, priority: int = 0):
         event_signature = abi_to_signature(abi_event)
@@ -126,6 +128,8 @@ class EVMEventDecoder:
         self.name = abi_event["name"]
         self.priority = priority
         self.formatters = {"address": to_checksum_address}
+        self._data_formatters = [self.formatters.get(typ) for typ in log_data_types]
+        self._topic_formatters = [self.formatters.get(typ) for typ in log_topics_types]
 
         self.indexed_params = len(log_topic_names)
 
@@ -150,8 +154,8 @@ class EVMEventDecoder:
             )
             return None
 
-        formatted_data = self.apply_formatters(decoded_data, self._data_types)
-        formatted_topics = self.apply_formatters(decoded_topics, self._topic_types)
+        formatted_data = format_values(decoded_data, self._data_formatters)
+        formatted_topics = format_values(decoded_topics, self._topic_formatters)
 
         return DecodedEvent(
             abi_name=self.abi_name,
@@ -167,15 +171,7 @@ class EVMEventDecoder:
         :param decoding_result: List of values returned from ABI Decoding
         :param types: List of types for each entry in decoding_result
         """
-        formatted_values = []
-        for value, typ in zip(decoding_result, types, strict=True):
-            formatter = self.formatters.get(typ)
-            if formatter is not None:
-                formatted_values.append(formatter(value))
-            else:
-                formatted_values.append(value)
-
-        return formatted_values
+        return format_values(decoding_result, [self.formatters.get(typ) for typ in types])
 
     def id_str(self, full_signature: bool = True) -> str:
         """If full_signature is True, returns EventName(types,...) Otherwise, returns event name"""
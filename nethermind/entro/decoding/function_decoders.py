@@ -14,7 +14,12 @@ from eth_utils.abi import (
 from nethermind.starknet_abi import AbiFunction, AbiParameter, DecodedFunction
 from nethermind.starknet_abi.abi_types import StarknetType
 
-from .utils import abi_to_signature, decode_evm_abi_from_types
+from .utils import (
+    abi_to_signature,
+    decode_evm_abi_from_types,
+    felts_to_ints,
+    format_values,
+)
 
 root_logger = logging.getLogger("nethermind")
 logger = root_logger.getChild("entro").getChild("decoding")
@@ -42,8 +47,8 @@ class CairoFunctionDecoder(AbiFunction):
         for starknet decoder
         """
         return super().decode(
-            calldata=[int.from_bytes(data, "big") for data in calldata],
-            result=[int.from_bytes(data, "big") for data in result or []],
+            calldata=felts_to_ints(calldata),
+            result=felts_to_ints(result or []),
         )
 
     def id_str(self, full_signature: bool = True) -> str:
@@ -74,6 +79,8 @@ class EVMFunctionDecoder:
     _output_names: list[str]
 
     _formatters: dict[str, Callable[[Any], Any]] = {}
+    _input_formatters: list[Callable[[Any], Any] | None]
+    _output_formatters: list[Callable[[Any], Any] | None]
 
     def __init__(self, abi_function: ABIFunction, abi_name: str, priority: int):
         self.priority = priority
@@ -90,6 +97,8 @@ class EVMFunctionDecoder:
         self.signature = function_signature_to_4byte_selector(self.function_signature)
 
         self._formatters = {"address": to_checksum_address}
+        self._input_formatters = [self._formatters.get(typ) for typ in self._input_types]
+        self._output_formatters = [self._formatters.get(typ) for typ in self._output_types]
 
     def decode(self, calldata: list[bytes], result: list[bytes] | None = None) -> DecodedFunction | None:
         """
@@ -105,7 +114,7 @@ class EVMFunctionDecoder:
             logger.debug(f"Error Decoding {self.function_signature} For Input {[c.hex() for c in calldata]}")
             return None
 
-        formatted_input = self.apply_formatters(decoded_input, self._input_types)
+        formatted_input = format_values(decoded_input, self._input_formatters)
         return_input = dict(zip(self._input_names, formatted_input, strict=True))
 
         if result and len(result) > 0:
@@ -117,7 +126,7 @@ class EVMFunctionDecoder:
                 )
                 return None
 
-            formatted_output = self.apply_formatters(decoded_output, self._output_types)
+            formatted_output = format_values(decoded_output, self._output_formatters)
             return_output = dict(zip(self._output_names, formatted_output, strict=True))
         else:
             return_output = None
@@ -136,15 +145,7 @@ class EVMFunctionDecoder:
         :param decoding_result: List of values returned from ABI Decoding
         :param types: List of types for each entry in decoding_result
         """
-        formatted_values = []
-        for value, typ in zip(decoding_result, types, strict=True):
-            formatter = self._formatters.get(typ)
-            if formatter is not None:
-                formatted_values.append(formatter(value))
-            else:
-                formatted_values.append(value)
-
-        return formatted_values
+        return format_values(decoding_result, [self._formatters.get(typ) for typ in types])
 
     def id_str(self, full_signature: bool = True) -> str:
         """
@@ -1,9 +1,12 @@
+import functools
+import itertools
 import logging
 import traceback
-from typing import Any
+from typing import Any, Callable, Literal, Sequence
 
-from eth_abi import decode as eth_abi_decode
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
 from eth_abi.exceptions import InsufficientDataBytes, NonEmptyPaddingBytes
+from eth_abi.registry import registry as eth_abi_registry
 from eth_typing.abi import ABI, ABIComponent, ABIEvent, ABIFunction
 
 # Redefinitions from eth_utils with correct typing
@@ -11,6 +14,9 @@ from eth_typing.abi import ABI, ABIComponent, ABIEvent, ABIFunction
 root_logger = logging.getLogger("nethermind")
 logger = root_logger.getChild("entro").getChild("decoding")
 
+# Annotated as a Literal so mypy accepts it as the byteorder argument of int.from_bytes
+_BIG_ENDIAN: Literal["big"] = "big"
+
 
 def abi_to_signature(abi: ABIFunction | ABIEvent) -> str:
     """
@@ -99,6 +105,46 @@ def signature_to_name(function_sig: str) -> str:
     return function_sig
 
 
+def format_values(values: Sequence[Any], formatters: list[Callable[[Any], Any] | None]) -> list[Any]:
+    """
+    Applies positional formatters to a decoding result.  Formatters are resolved from the ABI types when a decoder
+    is constructed, so decoding does not need to look up a formatter for every value.
+
+    :param values: Values returned from ABI Decoding
+    :param formatters: Formatter for each entry in values.  None entries leave the value unchanged
+    :return:
+    """
+    return [
+        value if formatter is None else formatter(value) for value, formatter in zip(values, formatters, strict=True)
+    ]
+
+
+def felts_to_ints(felts: Sequence[bytes]) -> list[int]:
+    """
+    Converts big-endian felt bytes into integers for the Cairo decoders.  Mapping int.from_bytes keeps the loop
+    in C, which is faster than a comprehension, or than splitting felts into numpy limbs and rebuilding python ints
+
+    >>> felts_to_ints([b"\\x01", b"\\x01\\x00"])
+    [1, 256]
+
+    :param felts: Felt values as bytes
+    :return:
+    """
+    return list(map(int.from_bytes, felts, itertools.repeat(_BIG_ENDIAN)))
+
+
+@functools.lru_cache(maxsize=None)
+def get_tuple_decoder(types: tuple[str, ...]) -> TupleDecoder:
+    """
+    Returns a TupleDecoder for a sequence of ABI types.  eth_abi.decode() rebuilds this decoder on every call, so
+    decoders are cached by type signature and shared between every event and function with the same types.
+
+    :param types: Tuple of ABI type strings
+    :return:
+    """
+    return TupleDecoder(decoders=tuple(eth_abi_registry.get_decoder(typ) for typ in types))
+
+
 def decode_evm_abi_from_types(types: list[str], data: bytes | bytearray) -> tuple[Any, ...] | None:
     """
     Decodes ABI data from types and data bytes.  Properly Handles various decoding errors by logging and
@@ -109,7 +155,7 @@ def decode_evm_abi_from_types(types: list[str], data: bytes | bytearray) -> tupl
     :return:
     """
     try:
-        return eth_abi_decode(types, data)
+        return get_tuple_decoder(tuple(types))(ContextFramesBytesIO(data))
     except InsufficientDataBytes:
         logger.debug(f"Insufficient data bytes while decoding {data.hex()} for types {types}")
         return None
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class DecodedFunction:
     """Function Decoding Result"""
 
@@ -14,7 +14,7 @@ class DecodedFunction:
     output: list[Any] | None
 
 
-@dataclass
+@dataclass(slots=True)
 class DecodedEvent:
     """Event Decoding Result"""
 
@@ -25,7 +25,7 @@ class DecodedEvent:
     data: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class DecodedTrace:
     """Decoded Trace with decoded inputs and outputs"""
 
@@ -1,10 +1,13 @@
 import logging
 from math import ceil, floor
+from typing import Any, Sequence
 
+from eth_abi.exceptions import DecodingError
 from eth_abi.packed import encode_packed
 from eth_typing import ChecksumAddress
 from eth_utils import keccak
 from eth_utils import to_checksum_address as tca
+from eth_utils.abi import get_abi_output_types
 from rich.logging import RichHandler
 from rich.progress import Progress
 from sqlalchemy import select, tuple_
@@ -31,6 +34,114 @@ from nethermind.entro.uniswap_v3.math import MAX_TICK, MIN_TICK, UniswapV3Math
 root_logger = logging.getLogger("nethermind")
 logger = root_logger.getChild("entro").getChild("uniswap_v3").getChild("chain_interface")
 
+MULTICALL3_ADDRESS = tca("0xcA11bde05977b3631167028862bE2a173976CA11")
+"""Multicall3 is deployed at the same address on mainnet and most EVM chains"""
+
+MULTICALL_BATCH_SIZE = 500
+"""Number of pool calls aggregated into a single eth_call"""
+
+MULTICALL3_AGGREGATE3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+
+def _batch_call(
+    contract: Contract,
+    function_name: str,
+    call_args: Sequence[tuple[Any, ...]],
+    at_block: BlockIdentifier,
+    *,
+    progress: Progress | None = None,
+    progress_task: Any = None,
+) -> list[Any]:
+    """
+    Calls a contract view function once for each set of arguments, returning the results in order.  Results match
+    ContractFunction.call(), so functions with a single output return the value instead of a tuple.
+
+    Calls are aggregated into eth_calls of MULTICALL_BATCH_SIZE calls through Multicall3.  If Multicall3 is not
+    deployed at at_block, the function is called once per set of arguments instead.
+
+    :param contract: web3.eth.Contract object
+    :param function_name: name of the view function to call
+    :param call_args: arguments for each call
+    :param at_block: block to execute calls at
+    :param progress: Optional Rich Progress Bar, advanced as calls complete
+    :param progress_task: Task ID of the progress bar to advance
+    """
+    if not call_args:
+        return []
+
+    if not contract.w3.eth.get_code(MULTICALL3_ADDRESS, block_identifier=at_block):
+        logger.info(f"Multicall3 not deployed at block {at_block}.  Calling {function_name}() sequentially")
+        results = []
+        for args in call_args:
+            results.append(getattr(contract.functions, function_name)(*args).call(block_identifier=at_block))
+            if progress:
+                progress.advance(progress_task)
+        return results
+
+    results = []
+    for batch_start in range(0, len(call_args), MULTICALL_BATCH_SIZE):
+        batch = call_args[batch_start : batch_start + MULTICALL_BATCH_SIZE]
+        results.extend(_multicall_batch(contract, function_name, batch, at_block))
+        if progress:
+            progress.advance(progress_task, len(batch))
+
+    return results
+
+
+def _multicall_batch(
+    contract: Contract,
+    function_name: str,
+    call_args: Sequence[tuple[Any, ...]],
+    at_block: BlockIdentifier,
+) -> list[Any]:
+    """Aggregates calls to a contract view function into a single Multicall3 eth_call, decoding each result"""
+    w3 = contract.w3
+    output_types = get_abi_output_types(contract.get_function_by_name(function_name).abi)
+    multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_AGGREGATE3_ABI)
+
+    calls = [(contract.address, False, contract.encode_abi(function_name, args=list(args))) for args in call_args]
+    call_results = multicall.functions.aggregate3(calls).call(block_identifier=at_block)
+
+    results = []
+    for _, return_data in call_results:
+        try:
+            decoded = w3.codec.decode(output_types, return_data)
+        except DecodingError as error:
+            # Calls to an address without code succeed with empty return data
+            raise BadFunctionCallOutput(f"Could not decode {function_name}() output at {contract.address}") from error
+        results.append(decoded[0] if len(decoded) == 1 else decoded)
+
+    return results
+
 
 def fetch_initialization_block(contract: Contract) -> int:
     """
@@ -159,20 +270,21 @@ def fetch_liquidity(
     logger.info(f"Fetching all Tick data at block {at_block}")
     tick_queue = _generate_tick_queue(contract, tick_spacing, at_block, progress)
 
-    if progress:
-        get_liquidity_task = progress.add_task("Fetching Ticks", total=len(tick_queue))
+    get_liquidity_task = progress.add_task("Fetching Ticks", total=len(tick_queue)) if progress else None
 
-    return_ticks = {}
-    for tick in tick_queue:
-        if progress:
-            progress.advance(get_liquidity_task)
-        return_ticks.update({tick: _get_tick(contract, tick, at_block)})
+    tick_data = _batch_call(
+        contract,
+        "ticks",
+        [(tick,) for tick in tick_queue],
+        at_block,
+        progress=progress,
+        progress_task=get_liquidity_task,
+    )
 
-    return return_ticks
+    return {tick: _parse_tick(data) for tick, data in zip(tick_queue, tick_data)}
 
 
-def _get_tick(contract: Contract, tick_number: int, at_block: BlockIdentifier) -> Tick:
-    tick_data = contract.functions.ticks(tick_number).call(block_identifier=at_block)
+def _parse_tick(tick_data: Sequence[Any]) -> Tick:
     return Tick(
         liquidity_gross=tick_data[0],
         liquidity_net=tick_data[1],
@@ -257,29 +369,25 @@ def fetch_positions(
     ).scalars()
     parsed_keys = [(tca(key[0]), key[1], key[2]) for key in position_keys]
 
-    if progress:
-        position_task = progress.add_task("Fetching LP Positions", total=len(parsed_keys))
+    position_task = progress.add_task("Fetching LP Positions", total=len(parsed_keys)) if progress else None
 
+    position_data = _batch_call(
+        contract,
+        "positions",
+        [(keccak(encode_packed(["address", "int24", "int24"], key)),) for key in parsed_keys],
+        at_block,
+        progress=progress,
+        progress_task=position_task,
+    )
     output_positions: dict[tuple[ChecksumAddress, int, int], PositionInfo] = {}
-    for key in parsed_keys:
-        logger.info(f"Queried Position Key: {key}")
-        output_positions.update({key: _get_position(contract, key, at_block)})
-        if progress:
-            progress.advance(position_task)
+    for key, position in zip(parsed_keys, position_data):
+        output_positions.update({key: _parse_position(position)})
 
     logger.info(f"Finished Querying {len(output_positions)} Positions")
     return output_positions
 
 
-def _get_position(
-    contract: Contract,
-    position_key: tuple[ChecksumAddress, int, int],
-    at_block: BlockIdentifier,
-) -> PositionInfo:
-    keccak_key = keccak(encode_packed(["address", "int24", "int24"], position_key))
-
-    position = contract.functions.positions(keccak_key).call(block_identifier=at_block)
-
+def _parse_position(position: Sequence[Any]) -> PositionInfo:
     return PositionInfo(
         liquidity=position[0],
         fee_growth_inside_0_last=position[1],
@@ -304,24 +412,23 @@ def fetch_observations(
     :return:
     """
     logger.info(f"Fetching {observation_cardinality} Observations")
-    if progress:
-        observation_task = progress.add_task("Fetching TWAP Oracle Observations", total=observation_cardinality)
+    observation_task = (
+        progress.add_task("Fetching TWAP Oracle Observations", total=observation_cardinality) if progress else None
+    )
 
-    observations = []
-    for i in range(observation_cardinality):
-        observations.append(_fetch_observation(contract, i, at_block))
-        if progress:
-            progress.advance(observation_task)
+    observation_data = _batch_call(
+        contract,
+        "observations",
+        [(i,) for i in range(observation_cardinality)],
+        at_block,
+        progress=progress,
+        progress_task=observation_task,
+    )
 
-    return observations
+    return [_parse_observation(observation) for observation in observation_data]
 
 
-def _fetch_observation(
-    contract: Contract,
-    observation_index: int,
-    at_block: BlockIdentifier,
-) -> OracleObservation:
-    observation_data = contract.functions.observations(observation_index).call(block_identifier=at_block)
+def _parse_observation(observation_data: Sequence[Any]) -> OracleObservation:
     return OracleObservation(
         block_timestamp=observation_data[0],
         tick_cumulative=observation_data[1],
@@ -343,18 +450,26 @@ def _generate_tick_queue(
         f"and {upper_bound_key * tick_spacing * 256}"
     )
     output_queue = []
-    if progress:
-        bitmap_task = progress.add_task("Generating Tick Queue from Bitmap", total=upper_bound_key - lower_bound_key)
-
-    for search_key in range(lower_bound_key, upper_bound_key):
-        try:
-            bitmap = contract.functions.tickBitmap(search_key).call(block_identifier=at_block)
-        except BadFunctionCallOutput as error:
-            raise UniswapV3Revert("Failed to fetch tick bitmap.  Likely querying uninitialized pool") from error
+    bitmap_task = (
+        progress.add_task("Generating Tick Queue from Bitmap", total=upper_bound_key - lower_bound_key)
+        if progress
+        else None
+    )
 
-        if progress:
-            progress.advance(bitmap_task)
+    search_keys = list(range(lower_bound_key, upper_bound_key))
+    try:
+        bitmaps = _batch_call(
+            contract,
+            "tickBitmap",
+            [(key,) for key in search_keys],
+            at_block,
+            progress=progress,
+            progress_task=bitmap_task,
+        )
+    except BadFunctionCallOutput as error:
+        raise UniswapV3Revert("Failed to fetch tick bitmap.  Likely querying uninitialized pool") from error
 
+    for search_key, bitmap in zip(search_keys, bitmaps):
         if not bitmap:
             continue
         for sub_tick in reversed(_get_pos_from_bitmap(bitmap)):
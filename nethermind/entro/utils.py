@@ -1,9 +1,18 @@
+import functools
+import json
 import random
-from typing import Literal
+import types
+from typing import Any, Literal
 
 from eth_typing import ChecksumAddress
 from eth_utils import to_checksum_address
 
+_json_impl: types.ModuleType
+try:
+    import orjson as _json_impl
+except ImportError:
+    _json_impl = json
+
 
 def random_address() -> ChecksumAddress:
     """
@@ -13,6 +22,29 @@ def random_address() -> ChecksumAddress:
     return to_checksum_address(random.randbytes(20).hex())
 
 
+def json_loads(data: str | bytes) -> Any:
+    """
+    Parses a JSON document.  Uses orjson if it is installed, otherwise falls back to the standard library json module
+    :param data: JSON string or raw UTF-8 bytes
+    :return: Parsed JSON object
+    """
+    return _json_impl.loads(data)
+
+
+def json_dumps(data: Any) -> str:
+    """
+    Serializes data to a compact JSON string.  Always uses the standard library json module, since orjson rejects
+    integers wider than 64 bits, which nearly every decoded EVM parameter set contains (wei amounts, sqrtPriceX96...)
+
+    >>> json_dumps({"amount": 2**256 - 1, "to": "0x00"})
+    '{"amount":115792089237316195423570985008687907853269984665640564039457584007913129639935,"to":"0x00"}'
+
+    :param data: JSON serializable object
+    :return: JSON string
+    """
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
 def uint_over_under_flow(value: int, precision: Literal[128, 160, 256]) -> int:
     """
     Handle uint over/underflow.  If value exceeds the max size of the uint, the value will overflow
@@ -28,9 +60,10 @@ def uint_over_under_flow(value: int, precision: Literal[128, 160, 256]) -> int:
     return value
 
 
+@functools.lru_cache(maxsize=4096)
 def camel_to_snake(name: str) -> str:
     """
-    Converts camel case to snake case
+    Converts camel case to snake case.  Results are memoized, since names come from a small set of ABI parameters
     :param name: name to convert
     :return: snake case name
     """
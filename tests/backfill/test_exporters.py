@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from typing import Any, Optional, Union
+
+import pytest
+
+from nethermind.entro.backfill.exporters import (
+    db_encode_dataclass,
+    db_encode_dataclasses,
+    encode_val,
+    shallow_asdict,
+)
+
+
+class Color(Enum):
+    red = "red"
+    blue = "blue"
+
+
+class Priority(IntEnum):
+    low = 1
+    high = 2
+
+
+@dataclass
+class Scalars:
+    number: int
+    text: str
+    ratio: float
+    flag: bool
+
+
+@dataclass
+class OptionalFields:
+    number: Optional[int]
+    data: bytes | None
+    color: Optional[Color]
+
+
+@dataclass
+class UnionFields:
+    value: Union[int, bytes]
+    items: list[int] | dict[str, int]
+
+
+@dataclass
+class EnumFields:
+    color: Color
+    priority: Priority
+
+
+@dataclass
+class BytesFields:
+    data: bytes
+    topics: list[bytes]
+
+
+@dataclass
+class Nested:
+    scalars: Scalars
+    children: list[EnumFields]
+
+
+@dataclass
+class ForwardRef:
+    unresolved: "UndefinedType"  # type: ignore[name-defined]
+    number: int
+
+
+def _encode_val_dict(dataclass: Any) -> dict[str, Any]:
+    return {k: encode_val(v, hex_encode_bytes=True, json_dump=False) for k, v in shallow_asdict(dataclass).items()}
+
+
+@pytest.mark.parametrize(
+    "dataclass",
+    [
+        Scalars(number=1, text="a", ratio=0.5, flag=True),
+        OptionalFields(number=None, data=None, color=None),
+        OptionalFields(number=3, data=b"\x01\x02", color=Color.blue),
+        UnionFields(value=5, items=[1, 2]),
+        UnionFields(value=b"\xff", items={"a": 1}),
+        EnumFields(color=Color.red, priority=Priority.high),
+        BytesFields(data=b"\x00" * 4, topics=[b"\x01", b"\x02"]),
+        Nested(
+            scalars=Scalars(number=1, text="a", ratio=0.5, flag=False),
+            children=[EnumFields(color=Color.red, priority=Priority.low)],
+        ),
+        ForwardRef(unresolved=b"\xab", number=7),
+        ForwardRef(unresolved=Color.blue, number=7),
+    ],
+)
+def test_db_encode_dataclass_matches_encode_val(dataclass):
+    assert db_encode_dataclass(dataclass) == _encode_val_dict(dataclass)
+
+
+@pytest.mark.parametrize(
+    "dataclass",
+    [
+        # Values that don't match the type hint of their field
+        Scalars(number=Priority.high, text=b"\x01", ratio=[1.5], flag=None),  # type: ignore[arg-type]
+        OptionalFields(number=b"\x02", data="0x02", color="red"),  # type: ignore[arg-type]
+        EnumFields(color=b"\x03", priority=2),  # type: ignore[arg-type]
+        BytesFields(data=[b"\x04"], topics=b"\x05"),  # type: ignore[arg-type]
+        Nested(scalars={"a": b"\x06"}, children=(b"\x07",)),  # type: ignore[arg-type]
+    ],
+)
+def test_db_encode_dataclass_handles_mismatched_values(dataclass):
+    assert db_encode_dataclass(dataclass) == _encode_val_dict(dataclass)
+
+
+def test_db_encode_dataclasses_mixed_types():
+    dataclasses = [
+        EnumFields(color=Color.red, priority=Priority.low),
+        EnumFields(color=Color.blue, priority=Priority.high),
+        BytesFields(data=b"\x01", topics=[]),
+        EnumFields(color=Color.red, priority=Priority.high),
+    ]
+
+    assert db_encode_dataclasses(dataclasses) == [_encode_val_dict(dataclass) for dataclass in dataclasses]
@@ -3,7 +3,6 @@ import uuid
 import pytest
 
 from nethermind.entro.backfill.planner import BackfillRangePlan
-from nethermind.entro.database.migrations import migrate_up
 from nethermind.entro.database.models.internal import BackfilledRange
 from nethermind.entro.exceptions import BackfillError
 from nethermind.entro.types.backfill import BackfillDataType, SupportedNetwork
@@ -17,90 +16,51 @@ DEFAULT_KWARGS = {
 }
 
 
-@pytest.fixture(name="setup_backfills", scope="function")
-def setup_backfills_fixture(
-    integration_postgres_db,
-    integration_db_session,
-):
+@pytest.fixture(name="setup_backfills")
+def setup_backfills_fixture():
+    """Returns a factory building three detached BackfilledRange conflicts.  The range planner never queries the DB"""
+
     def _setup_fixture() -> tuple[list[BackfilledRange], list[str]]:
         backfills = [
-            BackfilledRange(
-                backfill_id=uuid.uuid4().hex,
-                start_block=8_000_000,
-                end_block=9_000_000,
-                **DEFAULT_KWARGS,
-            ),
-            BackfilledRange(
-                backfill_id=uuid.uuid4().hex,
-                start_block=14_000_000,
-                end_block=15_000_000,
-                **DEFAULT_KWARGS,
-            ),
-            BackfilledRange(
-                backfill_id=uuid.uuid4().hex,
-                start_block=16_000_000,
-                end_block=17_000_000,
-                **DEFAULT_KWARGS,
-            ),
+            BackfilledRange(backfill_id=uuid.uuid4().hex, start_block=start, end_block=end, **DEFAULT_KWARGS)
+            for start, end in [(8_000_000, 9_000_000), (14_000_000, 15_000_000), (16_000_000, 17_000_000)]
         ]
-        migrate_up(integration_db_session.get_bind())
-
-        integration_db_session.add_all(backfills)
-        integration_db_session.commit()
 
         return backfills, [str(b.backfill_id) for b in backfills]
 
     return _setup_fixture
 
 
-def test_plan_generation_single_conflict(setup_backfills):
+@pytest.mark.parametrize(
+    "from_block, to_block, expected_ranges, expected_mode",
+    [
+        (14_500_000, 14_600_000, [], "empty"),
+        (14_000_000, 15_000_000, [], "empty"),
+        (14_500_000, 15_500_000, [(15_000_000, 15_500_000)], "extend"),
+        (13_500_000, 14_500_000, [(13_500_000, 14_000_000)], "extend"),
+        (13_500_000, 15_500_000, [(13_500_000, 14_000_000), (15_000_000, 15_500_000)], "extend"),
+    ],
+    ids=[
+        "start_inside_end_inside",
+        "start_at_end_at",
+        "start_inside_end_outside",
+        "start_outside_end_inside",
+        "start_outside_end_outside",
+    ],
+)
+def test_plan_generation_single_conflict(setup_backfills, from_block, to_block, expected_ranges, expected_mode):
     conflicts, _ = setup_backfills()
-    start_inside_end_inside = BackfillRangePlan.compute_db_backfills(
-        from_block=14_500_000,
-        to_block=14_600_000,
-        conflicting_backfills=conflicts,
-    )
-    start_at_end_at = BackfillRangePlan.compute_db_backfills(
-        from_block=14_000_000,
-        to_block=15_000_000,
-        conflicting_backfills=conflicts,
-    )
-    start_inside_end_outside = BackfillRangePlan.compute_db_backfills(
-        from_block=14_500_000,
-        to_block=15_500_000,
-        conflicting_backfills=conflicts,
-    )
-    start_outside_end_inside = BackfillRangePlan.compute_db_backfills(
-        from_block=13_500_000,
-        to_block=14_500_000,
-        conflicting_backfills=conflicts,
-    )
-    start_outside_end_outside = BackfillRangePlan.compute_db_backfills(
-        from_block=13_500_000,
-        to_block=15_500_000,
+    range_plan = BackfillRangePlan.compute_db_backfills(
+        from_block=from_block,
+        to_block=to_block,
         conflicting_backfills=conflicts,
     )
 
-    assert start_inside_end_inside.backfill_ranges == []
-    assert start_inside_end_inside.backfill_mode == "empty"
-
-    assert start_at_end_at.backfill_ranges == []
-    assert start_at_end_at.backfill_mode == "empty"
-
-    assert start_inside_end_outside.backfill_ranges == [(15_000_000, 15_500_000)]
-    assert start_inside_end_outside.backfill_mode == "extend"
-
-    assert start_outside_end_inside.backfill_ranges == [(13_500_000, 14_000_000)]
-    assert start_outside_end_inside.backfill_mode == "extend"
-
-    assert start_outside_end_outside.backfill_ranges == [
-        (13_500_000, 14_000_000),
-        (15_000_000, 15_500_000),
-    ]
-    assert start_outside_end_outside.backfill_mode == "extend"
+    assert range_plan.backfill_ranges == expected_ranges
+    assert range_plan.backfill_mode == expected_mode
 
 
-def test_start_before_all_end_after_all(setup_backfills, create_debug_logger):
+def test_start_before_all_end_after_all(setup_backfills):
     conflicts, _ = setup_backfills()
     range_plan = BackfillRangePlan.compute_db_backfills(
         from_block=5_000_000,
@@ -142,7 +102,7 @@ def test_start_before_all_end_after_all(setup_backfills, create_debug_logger):
     assert len(range_plan.remove_backfills) == 2
 
 
-def test_2_sided_extend(setup_backfills, create_debug_logger):
+def test_2_sided_extend(setup_backfills):
     conflicts, _ = setup_backfills()
     range_plan = BackfillRangePlan.compute_db_backfills(
         from_block=13_500_000,
@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy import Integer, Text, create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from nethermind.entro.database.writers.utils import bulk_insert
+
+
+class _TestBase(DeclarativeBase):
+    pass
+
+
+class Balance(_TestBase):
+    __tablename__ = "balances"
+
+    account: Mapped[str] = mapped_column(Text, primary_key=True)
+    block_number: Mapped[int] = mapped_column(Integer, primary_key=True)
+    balance: Mapped[int] = mapped_column(Integer, nullable=True)
+    token: Mapped[str] = mapped_column("token_symbol", Text, default="ETH")
+
+
+@pytest.fixture(name="session")
+def fixture_session():
+    engine = create_engine("sqlite://")
+    _TestBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(Balance(account="0x01", block_number=1, balance=100, token="USDC"))
+        session.commit()
+        yield session
+
+
+def _balances(session: Session) -> list[tuple]:
+    return (
+        session.query(Balance.account, Balance.block_number, Balance.balance, Balance.token)
+        .order_by(Balance.account, Balance.block_number)
+        .all()
+    )
+
+
+def test_bulk_insert_fail_raises_on_conflict(session):
+    bulk_insert(session, Balance, [{"account": "0x02", "block_number": 1, "balance": 5, "token": "DAI"}], "fail")
+    session.commit()
+
+    with pytest.raises(IntegrityError):
+        bulk_insert(session, Balance, [{"account": "0x01", "block_number": 1, "balance": 0}], "fail")
+    session.rollback()
+
+    assert _balances(session) == [("0x01", 1, 100, "USDC"), ("0x02", 1, 5, "DAI")]
+
+
+def test_bulk_insert_ignore_skips_conflicts(session):
+    rows = [
+        {"account": "0x01", "block_number": 1, "balance": 0, "token": "DAI"},
+        {"account": "0x01", "block_number": 2, "balance": 200, "token": "USDC"},
+    ]
+    bulk_insert(session, Balance, rows, "ignore")
+    session.commit()
+
+    assert _balances(session) == [("0x01", 1, 100, "USDC"), ("0x01", 2, 200, "USDC")]
+
+
+def test_bulk_insert_overwrite_updates_conflicts(session):
+    rows = [
+        {"account": "0x01", "block_number": 1, "balance": 0, "token": "DAI"},
+        {"account": "0x01", "block_number": 2, "balance": 200, "token": "USDC"},
+    ]
+    bulk_insert(session, Balance, rows, "overwrite")
+    session.commit()
+
+    assert _balances(session) == [("0x01", 1, 0, "DAI"), ("0x01", 2, 200, "USDC")]
+
+
+def test_bulk_insert_fills_scalar_defaults(session):
+    # Rows are keyed by attribute name, while the token column is named token_symbol
+    bulk_insert(session, Balance, [{"account": "0x03", "block_number": 1}, {"account": "0x04", "block_number": 1}])
+    session.commit()
+
+    assert _balances(session)[1:] == [("0x03", 1, None, "ETH"), ("0x04", 1, None, "ETH")]
@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+from eth_abi import decode, encode
+
+from nethermind.entro.uniswap_v3 import chain_interface
+from nethermind.entro.uniswap_v3.chain_interface import MULTICALL3_ADDRESS, _batch_call
+
+POOL_ADDRESS = "0x8ad599c3A0ff1De082011EFDDc58f1908eb6e6D8"
+
+TICKS_ABI = {
+    "name": "ticks",
+    "type": "function",
+    "inputs": [{"name": "tick", "type": "int24"}],
+    "outputs": [
+        {"name": "liquidityGross", "type": "uint128"},
+        {"name": "initialized", "type": "bool"},
+    ],
+}
+
+
+def _ticks_result(tick: int) -> tuple[int, bool]:
+    return abs(tick) * 10, tick % 2 == 0
+
+
+def _mock_pool_contract(multicall_deployed: bool) -> tuple[MagicMock, list[list[tuple]]]:
+    """Returns a mock UniswapV3Pool contract & the list of call batches sent to aggregate3"""
+    aggregate_batches: list[list[tuple]] = []
+
+    def _aggregate3(calls):
+        aggregate_batches.append(calls)
+        results = []
+        for target, allow_failure, call_data in calls:
+            assert target == POOL_ADDRESS and allow_failure is False
+            (tick,) = decode(["int24"], call_data)
+            results.append((True, encode(["uint128", "bool"], _ticks_result(tick))))
+        return MagicMock(call=MagicMock(return_value=results))
+
+    multicall = MagicMock()
+    multicall.functions.aggregate3.side_effect = _aggregate3
+
+    contract = MagicMock()
+    contract.address = POOL_ADDRESS
+    contract.w3.eth.get_code.return_value = b"\x60\x80" if multicall_deployed else b""
+    contract.w3.eth.contract.return_value = multicall
+    contract.w3.codec.decode.side_effect = decode
+    contract.get_function_by_name.return_value.abi = TICKS_ABI
+    contract.encode_abi.side_effect = lambda fn_name, args: encode(["int24"], args)
+    contract.functions.ticks.side_effect = lambda tick: MagicMock(
+        call=MagicMock(return_value=list(_ticks_result(tick)))
+    )
+
+    return contract, aggregate_batches
+
+
+def test_batch_call_aggregates_through_multicall(monkeypatch):
+    monkeypatch.setattr(chain_interface, "MULTICALL_BATCH_SIZE", 2)
+    contract, aggregate_batches = _mock_pool_contract(multicall_deployed=True)
+
+    ticks = [-60, 0, 60, 120, 180]
+    results = _batch_call(contract, "ticks", [(tick,) for tick in ticks], 18_000_000)
+
+    assert results == [_ticks_result(tick) for tick in ticks]
+    assert [len(batch) for batch in aggregate_batches] == [2, 2, 1]
+
+    contract.w3.eth.get_code.assert_called_once_with(MULTICALL3_ADDRESS, block_identifier=18_000_000)
+    contract.functions.ticks.assert_not_called()
+
+
+def test_batch_call_falls_back_to_sequential_calls():
+    contract, aggregate_batches = _mock_pool_contract(multicall_deployed=False)
+
+    ticks = [-60, 0, 60]
+    results = _batch_call(contract, "ticks", [(tick,) for tick in ticks], 1_000)
+
+    assert results == [list(_ticks_result(tick)) for tick in ticks]
+    assert aggregate_batches == []
+    assert contract.functions.ticks.call_count == 3
+
+
+def test_batch_call_without_calls_skips_rpc():
+    contract, _ = _mock_pool_contract(multicall_deployed=True)
+
+    assert _batch_call(contract, "ticks", [], "latest") == []
+    contract.w3.eth.get_code.assert_not_called()